@@ -11,10 +11,17 @@ Defines the main class of the packages, implementing the interface with the solv
 """
 
 import collections
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import io
+import mmap
 import subprocess
 import uuid
+import warnings
 from math import isfinite
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional
 import platform
 import os
 import numpy as np
@@ -29,6 +36,12 @@ class LindbladMPOSolver:
     DEFAULT_CYGWIN_PATH = "C:/cygwin64/bin/bash.exe"
     """Default path for the cygwin executable, which is used to invoke the solver (Windows only)."""
 
+    VERIFY_CACHE_MAX_SIZE = 64
+    """Maximal number of parameter-set digests remembered as successfully verified."""
+
+    _verify_cache = collections.OrderedDict()
+    """Digests of parameter sets that have already passed verification, in LRU order."""
+
     def __init__(
         self,
         parameters: Optional[dict] = None,
@@ -54,6 +67,7 @@ class LindbladMPOSolver:
         self.s_solver_path = s_solver_path
         self.s_id_suffix = ""
         self.result = {}
+        self._last_build_digest: Optional[str] = None
 
     def solve(self):
         """Solves the simulation and loads the result dictionaries."""
@@ -81,27 +95,42 @@ class LindbladMPOSolver:
                 according to the system platform.
         """
         if s_cygwin_path is None or s_solver_path is None:
-            s_solver_path1 = os.path.dirname(os.path.abspath(__file__))
-            s_system = platform.system().lower()
-            if s_system == "windows":
-                # On Windows we execute the solver using the cygwin bash, using the default path:
-                s_cygwin_path1 = LindbladMPOSolver.DEFAULT_CYGWIN_PATH
-
-                # s_solver_path should be of the form "/cygdrive/c/ ... ", and we use below a path
-                # relative to the current file's path in the package
-                s_solver_path1 = s_solver_path1.replace(":", "")
-                s_solver_path1 = s_solver_path1.replace("\\", "/")
-                s_solver_path1 = "/cygdrive/" + s_solver_path1
-                s_solver_path1 += LindbladMPOSolver.DEFAULT_EXECUTABLE_PATH + ".exe"
-            else:
-                s_cygwin_path1 = ""
-                s_solver_path1 += LindbladMPOSolver.DEFAULT_EXECUTABLE_PATH
+            s_cygwin_path1, s_solver_path1 = LindbladMPOSolver._default_paths()
             if s_cygwin_path is None:
                 s_cygwin_path = s_cygwin_path1
             if s_solver_path is None:
                 s_solver_path = s_solver_path1
         return s_cygwin_path, s_solver_path
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _default_paths() -> (str, str):
+        """Resolves the default cygwin path and solver path for the system platform.
+
+        The resolution depends only on the platform and the package location, so the
+        result is memoized for the lifetime of the process.
+
+        Returns:
+                (s_cygwin_path, s_solver_path): Default values for the cygwin path and
+                solver path according to the system platform.
+        """
+        s_solver_path = os.path.dirname(os.path.abspath(__file__))
+        s_system = platform.system().lower()
+        if s_system == "windows":
+            # On Windows we execute the solver using the cygwin bash, using the default path:
+            s_cygwin_path = LindbladMPOSolver.DEFAULT_CYGWIN_PATH
+
+            # s_solver_path should be of the form "/cygdrive/c/ ... ", and we use below a path
+            # relative to the current file's path in the package
+            s_solver_path = s_solver_path.replace(":", "")
+            s_solver_path = s_solver_path.replace("\\", "/")
+            s_solver_path = "/cygdrive/" + s_solver_path
+            s_solver_path += LindbladMPOSolver.DEFAULT_EXECUTABLE_PATH + ".exe"
+        else:
+            s_cygwin_path = ""
+            s_solver_path += LindbladMPOSolver.DEFAULT_EXECUTABLE_PATH
+        return s_cygwin_path, s_solver_path
+
     def build(self, parameters: Optional[dict] = None):
         """Write the parameters dictionary to the `.input.txt` file the solver expects.
 
@@ -142,64 +171,64 @@ class LindbladMPOSolver:
             s_id_suffix = "." + s_uuid
         s_output_path += s_id_suffix
         s_input_file = s_output_path + ".input.txt"
+        # The digest hashes array contents, so an in-place mutation of e.g. a coupling
+        # matrix is seen as a change and forces a rewrite of the input file.
+        s_params_digest = LindbladMPOSolver._parameters_digest(parameters)
+        if (
+            not b_uuid
+            and s_params_digest is not None
+            and s_params_digest == self._last_build_digest
+            and s_input_file == self.s_input_file
+            and os.path.isfile(s_input_file)
+        ):
+            # The input file written by the previous build is up to date.
+            return
 
         b_bond_indices = False
         first_bond_indices = []
         second_bond_indices = []
+        J = parameters.get("J")
+        J_z = parameters.get("J_z")
         interactions = []
-        if "J" in parameters.keys():
-            if isinstance(parameters["J"], np.ndarray):
-                interactions.append("J")
-        if "J_z" in parameters.keys():
-            if isinstance(parameters["J_z"], np.ndarray):
-                interactions.append("J_z")
+        if isinstance(J, np.ndarray):
+            interactions.append(J)
+        if isinstance(J_z, np.ndarray):
+            interactions.append(J_z)
         if len(interactions) == 2:
-            if parameters["J"].shape == parameters["J_z"].shape:
+            if J.shape == J_z.shape:
                 b_bond_indices = True
-                for i in range(parameters["J"].shape[0]):
-                    for j in range(parameters["J"].shape[1]):
-                        if parameters["J"][i, j] != 0 or parameters["J_z"][i, j] != 0:
-                            first_bond_indices.append(i + 1)
-                            second_bond_indices.append(j + 1)
+                bond_mask = (J != 0) | (J_z != 0)
             else:
                 raise Exception("J and J_z are not of the same size.")
         elif len(interactions) == 1:
             b_bond_indices = True
-            for i in range(parameters[interactions[0]].shape[0]):
-                for j in range(parameters[interactions[0]].shape[1]):
-                    if parameters[interactions[0]][i, j] != 0:
-                        first_bond_indices.append(i + 1)
-                        second_bond_indices.append(j + 1)
+            bond_mask = interactions[0] != 0
+        if b_bond_indices:
+            # A single vectorized scan of the matrices replaces a Python double loop.
+            bond_rows, bond_cols = np.nonzero(bond_mask)
+            first_bond_indices = (bond_rows + 1).tolist()
+            second_bond_indices = (bond_cols + 1).tolist()
 
         print("Creating solver input file:")
         s_input_file = s_input_file.replace("\\", "/")
         print(s_input_file)
-        file = open(s_input_file, "w")
-        for key in parameters.keys():
-            if key == "b_unique_id" or parameters[key] is None:
+        # Accumulate the whole input file in a string buffer, and write it to
+        # disk with a single buffered write at the end.
+        buf = io.StringIO()
+        for key, value in parameters.items():
+            if key == "b_unique_id" or value is None:
                 pass
             elif key == "output_files_prefix":
-                file.write(key + " = " + s_output_path + "\n")
+                buf.write(key + " = " + s_output_path + "\n")
             elif (
                 (key in ("J", "J_z"))
-                and isinstance(parameters[key], np.ndarray)
-                and len(parameters[key]) > 1
+                and isinstance(value, np.ndarray)
+                and len(value) > 1
             ):
-                # check if to create bond indices arrays
-                not_first_value = False
-                file.write(key + " = ")
-                for i in range(len(first_bond_indices)):
-                    if not_first_value:
-                        file.write(",")
-                    file.write(
-                        str(
-                            parameters[key][
-                                first_bond_indices[i] - 1, second_bond_indices[i] - 1
-                            ]
-                        )
-                    )
-                    not_first_value = True
-                file.write("\n")
+                # Gather the matrix values at the bond indices with one fancy-indexing
+                # operation, and emit them as one joined string.
+                bond_values = value[bond_rows, bond_cols]
+                buf.write(key + " = " + ",".join(map(str, bond_values)) + "\n")
             elif (
                 key == "init_pauli_state"
                 or key == "init_product_state"
@@ -208,28 +237,27 @@ class LindbladMPOSolver:
                 or key == "2q_components"
                 or key == "3q_components"
             ):
-                val = parameters[key]
-                if isinstance(val, (int, float, tuple, str)):
-                    val_list = [val]
+                if isinstance(value, (int, float, tuple, str)):
+                    val_list = [value]
                 else:
-                    val_list = val
-                n_indices = len(val_list)
-                file.write(key + " = ")
-                for i_op, op in enumerate(val_list):
+                    val_list = value
+                s_ops = []
+                for op in val_list:
+                    s_op = ""
                     b_tuple = isinstance(op, tuple)
                     if isinstance(op, str):
-                        file.write(str(op).strip("'"))
+                        s_op = str(op).strip("'")
                     elif isinstance(op, (int, float)) or (b_tuple and len(op) == 1):
-                        if key == "init_product_state":
-                            file.write("p ")
                         s_val = op[0] if b_tuple else op
-                        file.write(str(s_val))
+                        s_op = str(s_val)
+                        if key == "init_product_state":
+                            s_op = "p " + s_op
                     elif b_tuple:
                         if key == "init_product_state":
                             if len(op) == 2:
-                                file.write("q " + str(op[0]) + " " + str(op[1]))
+                                s_op = "q " + str(op[0]) + " " + str(op[1])
                             else:
-                                file.write(
+                                s_op = (
                                     "r "
                                     + str(op[0])
                                     + " "
@@ -238,101 +266,95 @@ class LindbladMPOSolver:
                                     + str(op[2])
                                 )
                         elif key == "apply_gates":
-                            file.write(str(op[0]) + " " + str(op[1]))
+                            s_op = str(op[0]) + " " + str(op[1])
                             for j_op in range(
                                 2, len(op)
                             ):  # qubit indices, 1-based in the file.
-                                file.write(" " + str(op[j_op] + 1))
-                    if i_op != n_indices - 1:
-                        file.write(",")
-                file.write("\n")
+                                s_op += " " + str(op[j_op] + 1)
+                    s_ops.append(s_op)
+                buf.write(key + " = " + ",".join(s_ops) + "\n")
             elif key == "custom_observables":
-                file.write(key + " = ")
-                observables: list = parameters[key]
-                n_observables = len(observables)
-                for i_obs, (obs_def, obs_components) in enumerate(observables):
-                    file.write(obs_def[0])
-                    # file.write(" ")
-                    # file.write(obs_def[1])
-                    file.write(":")
-                    n_components = len(obs_components)
-                    for i_component, obs_component in enumerate(obs_components):
-                        n_elements = len(obs_component)
-                        for i_element, element in enumerate(obs_component):
-                            if i_element == 0:
-                                file.write(element)
-                            else:
-                                file.write(
-                                    str(element + 1)
-                                )  # Qubit index for 'g' observables
-                            if i_element < n_elements - 1:
-                                file.write(" ")
-                        if i_component < n_components - 1:
-                            file.write(",")
-                    if i_obs < n_observables - 1:
-                        file.write(";")
-                file.write("\n")
-            elif isinstance(parameters[key], np.ndarray):
-                file.write(key + " = ")
-                for i in range(parameters[key].shape[0]):
-                    file.write(str(parameters[key][i]))
-                    if i + 1 != parameters[key].shape[0]:
-                        file.write(",")
-                file.write("\n")
+                observables: list = value
+                s_obs_list = []
+                for obs_def, obs_components in observables:
+                    s_components = []
+                    for obs_component in obs_components:
+                        s_components.append(
+                            " ".join(
+                                element
+                                if i_element == 0
+                                else str(element + 1)  # Qubit index for 'g' observables
+                                for i_element, element in enumerate(obs_component)
+                            )
+                        )
+                    s_obs_list.append(obs_def[0] + ":" + ",".join(s_components))
+                buf.write(key + " = " + ";".join(s_obs_list) + "\n")
+            elif isinstance(value, np.ndarray):
+                # Format the whole array in one C-level pass; '%.17g' preserves the
+                # round-trip precision of the doubles.
+                buf.write(key + " = ")
+                np.savetxt(
+                    buf, np.atleast_2d(value), fmt="%.17g", delimiter=",", newline=""
+                )
+                buf.write("\n")
             elif key == "1q_indices":
-                n_indices = len(parameters[key])
-                file.write(key + " = ")
-                for i_site, site in enumerate(parameters[key]):
-                    file.write(str(site + 1))
-                    # +1 because Python indices are 0-based, while iTensor's are 1-based
-                    if i_site != n_indices - 1:
-                        file.write(",")
-                file.write("\n")
+                # +1 because Python indices are 0-based, while iTensor's are 1-based
+                buf.write(
+                    key + " = " + ",".join(str(site + 1) for site in value) + "\n"
+                )
             elif (
                 key == "2q_indices"
                 or key == "init_graph_state"
                 or key == "init_cz_gates"
             ):
-                file.write(key + " = ")
-                n_tuples = len(parameters[key])
-                for i_2q_tuple, _2q_tuple in enumerate(parameters[key]):
-                    file.write(str(_2q_tuple[0] + 1) + "," + str(_2q_tuple[1] + 1))
-                    # +1 because Python indices are 0-based, while iTensor's are 1-based
-                    if i_2q_tuple != n_tuples - 1:
-                        file.write(",")
-                file.write("\n")
+                # +1 because Python indices are 0-based, while iTensor's are 1-based
+                buf.write(
+                    key
+                    + " = "
+                    + ",".join(
+                        str(_2q_tuple[0] + 1) + "," + str(_2q_tuple[1] + 1)
+                        for _2q_tuple in value
+                    )
+                    + "\n"
+                )
             elif key == "3q_indices":
-                file.write(key + " = ")
-                n_tuples = len(parameters[key])
-                for i_3q_tuple, _3q_tuple in enumerate(parameters[key]):
-                    file.write(
+                # +1 because Python indices are 0-based, while iTensor's are 1-based
+                buf.write(
+                    key
+                    + " = "
+                    + ",".join(
                         str(_3q_tuple[0] + 1)
                         + ","
                         + str(_3q_tuple[1] + 1)
                         + ","
                         + str(_3q_tuple[2] + 1)
+                        for _3q_tuple in value
                     )
-                    # +1 because Python indices are 0-based, while iTensor's are 1-based
-                    if i_3q_tuple != n_tuples - 1:
-                        file.write(",")
-                file.write("\n")
+                    + "\n"
+                )
             else:
-                file.write(key + " = " + str(parameters[key]).strip("[]") + "\n")
+                if isinstance(value, (list, tuple)):
+                    # A single-pass join, avoiding the repr of the whole list (and
+                    # the bracket stripping, which could mangle a string value).
+                    s_value = ",".join(map(str, value))
+                else:
+                    s_value = str(value)
+                buf.write(key + " = " + s_value + "\n")
         if b_bond_indices:
-            file.write(
-                "first_bond_indices = "
-                + str(first_bond_indices).strip("[]").replace(" ", "")
-                + "\n"
+            buf.write(
+                "first_bond_indices = " + ",".join(map(str, first_bond_indices)) + "\n"
             )
-            file.write(
+            buf.write(
                 "second_bond_indices = "
-                + str(second_bond_indices).strip("[]").replace(" ", "")
+                + ",".join(map(str, second_bond_indices))
                 + "\n"
             )
-        file.close()
+        with open(s_input_file, "w") as file:
+            file.write(buf.getvalue())
         self.s_input_file = s_input_file
         self.s_output_path = s_output_path
         self.s_id_suffix = s_id_suffix
+        self._last_build_digest = s_params_digest
 
     @staticmethod
     def execute(s_cygwin_path=None, s_solver_path=None, s_input_file="") -> int:
@@ -350,22 +372,103 @@ class LindbladMPOSolver:
             s_cygwin_path, s_solver_path
         )
         if s_cygwin_path:
-            call_string = s_cygwin_path + ' --login -c "'
+            # On Windows the solver must be invoked through the cygwin bash shell.
+            s_bash_command = s_solver_path
+            if s_input_file:
+                s_bash_command += " input_file '" + str(s_input_file) + "'"
+            call_args = [s_cygwin_path, "--login", "-c", s_bash_command]
         else:
-            call_string = ""
-        call_string += s_solver_path
-        if s_input_file:
-            call_string += " input_file '" + str(s_input_file) + "'"
-            if s_cygwin_path:
-                call_string += '"'
+            # Invoke the solver executable directly, without an intermediate shell.
+            call_args = [s_solver_path]
+            if s_input_file:
+                call_args += ["input_file", str(s_input_file)]
         print("Executing solver with command:")
-        print("\t" + call_string + "\n")
+        print("\t" + " ".join(call_args) + "\n")
 
-        process = subprocess.Popen(call_string, shell=True)
-        exit_code = process.wait()
+        exit_code = subprocess.run(call_args, shell=False, check=False).returncode
         print(f"Solver process terminated with exit code {exit_code}.\n")
         return exit_code
 
+    @staticmethod
+    def execute_batch(
+        input_files: list,
+        s_cygwin_path=None,
+        s_solver_path=None,
+        parallel: Optional[int] = None,
+    ) -> list:
+        """Execute the simulation solver for multiple input files concurrently.
+
+        Args:
+                input_files : a list of input file paths, one per solver invocation.
+                s_cygwin_path : the path of the cygwin bash terminal execution
+                s_solver_path : the path of the simulator executable
+                parallel : the maximal number of concurrent solver processes. If None, half
+                        of the available cpu count is used (the solver itself is multithreaded).
+
+        Returns:
+                exit codes : a list with the exit code of each solver process, ordered as
+                        the input files.
+        """
+        s_cygwin_path, s_solver_path = LindbladMPOSolver.process_default_paths(
+            s_cygwin_path, s_solver_path
+        )
+        if parallel is None:
+            parallel = max(1, (os.cpu_count() or 2) // 2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+            futures = [
+                executor.submit(
+                    LindbladMPOSolver.execute, s_cygwin_path, s_solver_path, s_file
+                )
+                for s_file in input_files
+            ]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def solve_batch(
+        parameters_list: list,
+        s_cygwin_path: Optional[str] = None,
+        s_solver_path: Optional[str] = None,
+        parallel: Optional[int] = None,
+    ) -> list:
+        """Solve multiple simulations, running the solver processes concurrently.
+
+        All input files are written first, then the solver invocations are overlapped
+        using a thread pool, and finally the result dictionaries are loaded.
+
+        Args:
+                parameters_list : a list of model parameter dictionaries, one per simulation.
+                s_cygwin_path: On Windows only, indicates the cygwin executable path. A default
+                        location will be assigned if this argument is not passed.
+                s_solver_path: Indicates the solver executable path. A default location will be
+                        assigned if this argument is not passed.
+                parallel : the maximal number of concurrent solver processes. If None, half
+                        of the available cpu count is used (the solver itself is multithreaded).
+
+        Returns:
+                solvers : a list of LindbladMPOSolver instances with their results loaded,
+                        ordered as the parameter dictionaries.
+        """
+        solvers = [
+            LindbladMPOSolver(parameters, s_cygwin_path, s_solver_path)
+            for parameters in parameters_list
+        ]
+        for solver in solvers:
+            solver.build()
+        exit_codes = LindbladMPOSolver.execute_batch(
+            [solver.s_input_file for solver in solvers],
+            s_cygwin_path,
+            s_solver_path,
+            parallel,
+        )
+        for solver, exit_code in zip(solvers, exit_codes):
+            if exit_code != 0:
+                raise Exception(
+                    "There was an error executing the solver for the input file "
+                    f"{solver.s_input_file}."
+                )
+            solver.result = LindbladMPOSolver.load_output(solver.s_output_path)
+        return solvers
+
     @staticmethod
     def load_output(s_output_path: str):
         """Read the three solver output files and returns a dictionary with the results.
@@ -396,54 +499,158 @@ class LindbladMPOSolver:
         """
         full_filename = s_output_path + f".{s_output_type}.dat"
         result = collections.OrderedDict()
-        if os.path.isfile(full_filename):
-            print("Loading output data file: " + full_filename)
-            file = open(full_filename, "r")
-            file.readline()
-            for line in file:
-                words = line.strip().split()
-                if not words:
-                    continue
-                LindbladMPOSolver._read_data_line(s_output_type, words, result)
-            file.close()
-        else:
+        if not os.path.isfile(full_filename):
             print("Skipping non-existing file: " + full_filename)
+            return result
+        print("Loading output data file: " + full_filename)
+        if s_output_type in ("obs-1q", "obs-2q", "obs-3q"):
+            n_index_cols = int(s_output_type[4])
+        elif s_output_type in ("obs-cu", "global"):
+            n_index_cols = 0
+        else:
+            raise Exception(f"Unknown output type {s_output_type}.")
+        arrays = None
+        if _HAS_NUMBA:
+            # Optional accelerator: tokenize and parse the file with a JIT-compiled
+            # kernel; falls through to the numpy parse when unavailable or unusable.
+            arrays = LindbladMPOSolver._read_data_file_fast(full_filename, n_index_cols)
+        if arrays is not None:
+            t_arr, op_arr, q_arr, val_arr = arrays
+            if t_arr.size == 0:
+                return result
+        else:
+            try:
+                # Parse the whole file in one vectorized pass. The columns are the time,
+                # the observable name, n_index_cols qubit indices, and the value.
+                with warnings.catch_warnings():
+                    # The files contain empty lines between time steps, for which newer
+                    # numpy versions issue a (benign) row-counting warning.
+                    warnings.simplefilter("ignore")
+                    # Map the file into memory and hand the solver output to np.loadtxt
+                    # as one buffer, instead of having it iterate the file line by line.
+                    with open(full_filename, "rb") as file:
+                        with mmap.mmap(
+                            file.fileno(), 0, access=mmap.ACCESS_READ
+                        ) as mm_data:
+                            data = np.loadtxt(
+                                io.BytesIO(mm_data), dtype=str, comments="#", ndmin=2
+                            )
+                if data.size == 0:
+                    return result
+                if data.shape[1] != 3 + n_index_cols:
+                    raise ValueError(
+                        f"Expected {3 + n_index_cols} columns in {full_filename}."
+                    )
+                t_arr = data[:, 0].astype(np.float64)
+                op_arr = np.char.lower(data[:, 1])
+                val_arr = data[:, -1].astype(np.float64)
+                # Data files are storing 1-based indices because of iTensor, while we
+                # use 0-based indices:
+                q_arr = data[:, 2 : 2 + n_index_cols].astype(np.int64) - 1
+            except ValueError:
+                # Fall back to a line-by-line parse, e.g. for a truncated last line of an
+                # interrupted simulation. The rows are filled into arrays preallocated
+                # using a line count of the file, rather than appended to growing lists.
+                with open(full_filename, "rb") as file:
+                    n_lines = sum(
+                        chunk.count(b"\n")
+                        for chunk in iter(lambda: file.read(1 << 20), b"")
+                    )
+                t_arr = np.empty(n_lines, np.float64)
+                val_arr = np.empty(n_lines, np.float64)
+                q_arr = np.empty((n_lines, n_index_cols), np.int64)
+                ops = [""] * n_lines
+                n_rows = 0
+                with open(full_filename, "r") as file:
+                    file.readline()
+                    for line in file:
+                        words = line.strip().split()
+                        if not words:
+                            continue
+                        try:
+                            t = float(words[0])
+                            op = words[1].lower()
+                            val = float(words[-1])
+                            # Data files are storing 1-based indices because of iTensor,
+                            # while we use 0-based indices:
+                            q_indices = [
+                                int(words[2 + i]) - 1 for i in range(n_index_cols)
+                            ]
+                        except (ValueError, IndexError):
+                            # Skip an unparsable (truncated) line.
+                            continue
+                        t_arr[n_rows] = t
+                        val_arr[n_rows] = val
+                        q_arr[n_rows] = q_indices
+                        ops[n_rows] = op
+                        n_rows += 1
+                if n_rows == 0:
+                    return result
+                t_arr = t_arr[:n_rows]
+                val_arr = val_arr[:n_rows]
+                q_arr = q_arr[:n_rows]
+                op_arr = np.asarray(ops[:n_rows])
+        # Group the rows by the observable name and qubit indices, preserving both the
+        # first-appearance order of the observables and the time ordering of the rows.
+        # Each entry of the result dictionary holds a pair of contiguous float64
+        # arrays, built here directly without an intermediate list conversion.
+        group_arrays = [op_arr] + [q_arr[:, i] for i in range(n_index_cols)]
+        _, first_rows, inverse = np.unique(
+            np.rec.fromarrays(group_arrays), return_index=True, return_inverse=True
+        )
+        sort_idx = np.argsort(inverse, kind="stable")
+        group_offsets = np.cumsum(np.bincount(inverse))[:-1]
+        groups = np.split(sort_idx, group_offsets)
+        for i_group in np.argsort(first_rows):
+            rows = groups[i_group]
+            i_first = rows[0]
+            q_indices = tuple(int(q) for q in q_arr[i_first])
+            result[(str(op_arr[i_first]), q_indices)] = (t_arr[rows], val_arr[rows])
         return result
 
     @staticmethod
-    def _read_data_line(s_output_type: str, words: list, result: Dict):
-        t = float(words[0])
-        op = words[1]
-        val = float(words[-1])
-        if s_output_type == "obs-1q":
-            q_index1 = int(words[2]) - 1
-            # data files are storing 1-based indices because of iTensor, while we use 0-based indices
-            q_indices = (q_index1,)
-        elif s_output_type == "obs-2q":
-            q_index1 = int(words[2]) - 1
-            # data files are storing 1-based indices because of iTensor, while we use 0-based indices
-            q_index2 = int(words[3]) - 1
-            q_indices = (q_index1, q_index2)
-        elif s_output_type == "obs-3q":
-            q_index1 = int(words[2]) - 1
-            # data files are storing 1-based indices because of iTensor, while we use 0-based indices
-            q_index2 = int(words[3]) - 1
-            q_index3 = int(words[4]) - 1
-            q_indices = (q_index1, q_index2, q_index3)
-        elif s_output_type in ["obs-cu", "global"]:
-            q_indices = ()
+    def _read_data_file_fast(full_filename: str, n_index_cols: int):
+        """Parses an output data file with the optional numba-compiled tokenizer.
+        Args:
+                full_filename : the output data file name.
+                n_index_cols : the number of qubit-index columns of the file type.
+        Returns:
+                A (t_arr, op_arr, q_arr, val_arr) tuple of per-row arrays, or None if
+                this parse is unavailable or the file contains a line it cannot handle
+                (the caller then falls back to the numpy text parse).
+        """
+        kernel = _numba_parse_rows()
+        if kernel is None:
+            return None
+        with open(full_filename, "rb") as file:
+            s_data = file.read()
+        buf = np.frombuffer(s_data, dtype=np.uint8)
+        n_max = int(np.count_nonzero(buf == 10)) + 1
+        t_arr = np.empty(n_max, np.float64)
+        val_arr = np.empty(n_max, np.float64)
+        q_arr = np.empty((n_max, n_index_cols), np.int64)
+        op_bounds = np.empty((n_max, 2), np.int64)
+        try:
+            n_rows = kernel(buf, n_index_cols, t_arr, val_arr, q_arr, op_bounds)
+        except Exception:  # pylint: disable=broad-except
+            # The kernel is compiled lazily on the first call; an optional
+            # accelerator failing to compile or run must never break parsing,
+            # so disable it and let the caller use the numpy parse.
+            global _parse_rows_numba
+            _parse_rows_numba = False
+            return None
+        if n_rows < 0:
+            return None
+        if n_rows == 0:
+            op_arr = np.empty(0, dtype=str)
         else:
-            raise Exception(f"Unknown output type {s_output_type}.")
-        # The result dictionary is indexed by a tuple, first entry is a name, second entry is
-        # a tuple of qubit indices - 0 indices for the global data, 1 for 1Q observables, 2 for 2Q.
-        obs_data = result.get((op.lower(), q_indices), None)
-        # obs_data is a tuple, first entry is a list of times, second entry holds the values.
-        if obs_data is None:
-            obs_data = (list(), list())
-            result[(op.lower(), q_indices)] = obs_data
-        # TODO: optimize the list appends
-        obs_data[0].append(t)
-        obs_data[1].append(val)
+            op_arr = np.asarray(
+                [
+                    s_data[op_bounds[i, 0] : op_bounds[i, 1]].decode().lower()
+                    for i in range(n_rows)
+                ]
+            )
+        return t_arr[:n_rows], op_arr, q_arr[:n_rows], val_arr[:n_rows]
 
     @staticmethod
     # checks if the value is int (for cleaner code)
@@ -462,6 +669,24 @@ class LindbladMPOSolver:
         # can also be a python int:
         return isinstance(value, (float, int))
 
+    @staticmethod
+    def _as_numeric_array(value) -> Optional[np.ndarray]:
+        """Converts the value to a numeric ndarray (for cleaner and faster validation).
+        Args:
+                value : value to convert, typically a (possibly nested) list of numbers.
+        Returns:
+                The ndarray if the value is a valid numeric array, otherwise None.
+        """
+        try:
+            arr = np.asarray(value)
+        except (ValueError, TypeError):
+            # A ragged nested list (or unsupported content) cannot form an array.
+            return None
+        # 'b' is included since Python bools are ints, as accepted by is_float().
+        if arr.dtype.kind not in "iufb":
+            return None
+        return arr
+
     @staticmethod
     # returns the number of qubits based on the given parameters, returns -1 if found an error
     def _get_number_of_qubits(parameters: Dict) -> int:
@@ -470,6 +695,37 @@ class LindbladMPOSolver:
                 return parameters["N"]
         return -1
 
+    @staticmethod
+    def _parameters_digest(
+        parameters: dict, ignore_params: Optional[list] = None
+    ) -> Optional[str]:
+        """Returns a stable digest of the parameters (by value), or None if one cannot
+                be computed. Used for memoizing the results of successful verifications.
+        Args:
+                parameters: A dictionary of solver parameters.
+                ignore_params: The ignored parameter names, included in the digest since they
+                        change the verification outcome.
+        Returns:
+                A hex digest string uniquely identifying the contents of the arguments, or
+                None if some value does not support a stable representation.
+        """
+        try:
+            sha = hashlib.sha256()
+            sha.update(repr(sorted(ignore_params)).encode() if ignore_params else b"")
+            for key in sorted(parameters.keys()):
+                val = parameters[key]
+                if isinstance(val, np.ndarray):
+                    s_val = str(val.dtype) + str(val.shape)
+                    sha.update((key + "=ndarray:" + s_val).encode())
+                    sha.update(val.tobytes())
+                else:
+                    sha.update((key + "=" + type(val).__name__ + ":").encode())
+                    sha.update(repr(val).encode())
+            return sha.hexdigest()
+        except Exception:  # pylint: disable=broad-except
+            # An unhashable or exotic value - simply skip the memoization.
+            return None
+
     def _virtual_verify_parameters(self, ignore_params: Optional[list] = None) -> str:
         """An overridable function that verifies the parameters by calling verify_parameters().
 
@@ -512,689 +768,24 @@ class LindbladMPOSolver:
                 "values\n"
             )
             return check_msg
-        N = LindbladMPOSolver._get_number_of_qubits(parameters)
-        for key in dict.keys(parameters):
-            if parameters[key] is None or (
-                isinstance(parameters[key], str) and "" == parameters[key]
+        s_digest = LindbladMPOSolver._parameters_digest(parameters, ignore_params)
+        verify_cache = LindbladMPOSolver._verify_cache
+        if s_digest is not None and s_digest in verify_cache:
+            # An identical parameters dictionary has already been verified successfully.
+            verify_cache.move_to_end(s_digest)
+            return ""
+        for key, value in parameters.items():
+            if value is None or (
+                isinstance(value, str) and "" == value
             ):  # ignore empty entrances/space holders <"">
                 continue
-            flag_continue = False
-
-            if key == "N":
-                if not LindbladMPOSolver._is_int(parameters[key]):
-                    check_msg += "Error 120: " + key + " should be an integer\n"
-                    continue
-                if parameters[key] <= 0:
-                    check_msg += (
-                        "Error 130: " + key + " should be bigger/equal to 1 (integer)\n"
-                    )
-                    continue
-            elif key == "t_init" or key == "t_final" or key == "tau":
-                if not LindbladMPOSolver.is_float(parameters[key]):
-                    check_msg += "Error 140: " + key + " is not a float\n"
-                    continue
-                if key != "t_init" and parameters[key] <= 0:
-                    check_msg += "Error 150: " + key + " must be larger than 0\n"
-                    continue
-                if key == "t_init" and parameters[key] > parameters["t_final"]:
-                    check_msg += (
-                        "Error 151: " + key + " must be equal or smaller than t_final\n"
-                    )
-                    continue
-            elif (key == "l_x") or (key == "l_y"):
-                if not LindbladMPOSolver._is_int(parameters[key]):
-                    check_msg += "Error 160: " + key + " should be an integer\n"
-                    continue
-                if parameters[key] < 0:
-                    check_msg += (
-                        "Error 170: "
-                        + key
-                        + " should be equal to or larger than 0 (integer)\n"
-                    )
-                    continue
-            elif key == "output_step" or key == "force_rho_hermitian_step":
-                if not LindbladMPOSolver._is_int(parameters[key]):
-                    check_msg += "Error 180: " + key + " should be an integer\n"
-                    continue
-                if parameters[key] < 0:
-                    check_msg += (
-                        "Error 190: "
-                        + key
-                        + " should be equal to or larger than 0 (integer)\n"
-                    )
-                    continue
-            elif (
-                (key == "h_x")
-                or (key == "h_y")
-                or (key == "h_z")
-                or (key == "g_0")
-                or (key == "g_1")
-                or (key == "g_2")
-            ):
-                if LindbladMPOSolver.is_float(parameters[key]):
-                    continue
-                if N == -1:
-                    check_msg += (
-                        "Error 200: " + key + " could not be validated because 'N' "
-                        "(or alternatively l_x, l_y) are not "
-                        "defined properly\n "
-                    )
-                    continue
-                if isinstance(parameters[key], list):
-                    if len(parameters[key]) != N:
-                        check_msg += (
-                            "Error 210: " + key + " is not a float / N-length list / "
-                            "numpy array (of floats)\n"
-                        )
-                        continue
-                    for element in parameters[key]:
-                        if not LindbladMPOSolver.is_float(element):
-                            check_msg += (
-                                "Error 220: " + key + "is not a float / N-length list "
-                                "/ numpy array (of floats)\n "
-                            )
-                            flag_continue = True
-                            break
-                    if flag_continue:
-                        continue
-                elif isinstance(parameters[key], np.ndarray):
-                    if (str((parameters[key]).dtype).find("int") == -1) and (
-                        str((parameters[key]).dtype).find("float") == -1
-                    ):
-                        check_msg += (
-                            "Error 230: " + key + " is not a float / N-length list / "
-                            "numpy array (of floats)\n"
-                        )
-                        continue
-                    if parameters[key].size == 1:
-                        continue
-                    if (parameters[key].shape[0] != N) or (
-                        parameters[key].shape[0] != parameters[key].size
-                    ):
-                        check_msg += (
-                            "Error 240: " + key + " is not a float / N-length list / "
-                            "numpy array (of floats)\n"
-                        )
-                        continue
-                else:
-                    check_msg += (
-                        "Error 250: " + key + " is not a float / N-length list / numpy "
-                        "array (of floats)\n"
-                    )
-                    continue
-            elif (key == "J_z") or (key == "J"):
-                if LindbladMPOSolver.is_float(parameters[key]):
-                    continue
-                if N == -1:
-                    check_msg += (
-                        "Error 260: " + key + " could not be validated because 'N' "
-                        "(or alternatively l_x, l_y) are not "
-                        "defined properly\n"
-                    )
-                    continue
-                if isinstance(parameters[key], list):
-                    if len(parameters[key]) != N:
-                        check_msg += (
-                            "Error 270: "
-                            + key
-                            + " should be a constant, or a square matrix"
-                            " (nested lists/np.array) of N^2 floats\n "
-                        )
-                        continue
-                    for lst in parameters[key]:
-                        if not isinstance(lst, list):
-                            check_msg += (
-                                "Error 280: "
-                                + key
-                                + "should be a constant, or a square "
-                                "matrix (nested lists/np.array) of "
-                                "floats with a size N^2\n "
-                            )
-                            flag_continue = True
-                            break
-                        if len(lst) != N:
-                            check_msg += (
-                                "Error 290: "
-                                + key
-                                + "should be a constant, or a square matrix (nested "
-                                "lists/np.array) with N^2 floats\n"
-                            )
-                            flag_continue = True
-                            break
-                        for val in lst:
-                            if not LindbladMPOSolver.is_float(val):
-                                check_msg += (
-                                    "Error 300: "
-                                    + key
-                                    + "should be a constant, or a square matrix (nested "
-                                    "lists/np.array) in the size of number_of_qubits^2 "
-                                    "of floats\n"
-                                )
-                                flag_continue = True
-                                break
-                        if flag_continue:
-                            break
-                    if flag_continue:
-                        continue
-                elif isinstance(parameters[key], np.ndarray):
-                    if (str((parameters[key]).dtype).find("int") == -1) and (
-                        str((parameters[key]).dtype).find("float") == -1
-                    ):
-                        check_msg += (
-                            "Error 310: "
-                            + key
-                            + "should be a constant, or a square matrix (nested "
-                            "lists/np.array) in the size of number_of_qubits^2 of "
-                            "floats\n"
-                        )
-                        continue
-                    if parameters[key].size == 1:
-                        continue
-                    if parameters[key].shape[0] != N:
-                        check_msg += (
-                            "Error 320: "
-                            + key
-                            + "should be a constant, or a square matrix (nested "
-                            "lists/np.array) in the size of number_of_qubits^2 of "
-                            "floats\n"
-                        )
-                        continue
-                    if parameters[key].shape[0] ** 2 != parameters[key].size:
-                        check_msg += (
-                            "Error 330: "
-                            + key
-                            + "should be a constant, or a square matrix (nested "
-                            "lists/np.array) in the size of number_of_qubits^2 of "
-                            "floats\n"
-                        )
-                        continue
-                else:
-                    check_msg += (
-                        "Error 340: "
-                        + key
-                        + " should be a constant, or a square matrix (nested "
-                        "list/np.array) in the size of number_of_qubits^2 of floats\n"
-                    )
-                    continue
-            elif key == "apply_gates" or key == "custom_observables":
-                if (
-                    not isinstance(parameters[key], tuple)
-                    and not isinstance(parameters[key], list)
-                    and not isinstance(parameters[key], np.ndarray)
-                ):
-                    check_msg += (
-                        "Error 345: "
-                        + key
-                        + " must be a tuple or a list/ array of tuples\n"
-                    )
-                    continue
-                custom_list = (
-                    [parameters[key]]
-                    if isinstance(parameters[key], tuple)
-                    else parameters[key]
-                )
-                if key == "apply_gates":
-                    for g_tuple in custom_list:
-                        tuple_len = len(g_tuple)
-                        if tuple_len < 3 or tuple_len > 4:
-                            check_msg += (
-                                "Error 346: every member of "
-                                + key
-                                + " must be of 3 or 4 elements\n"
-                            )
-                            continue
-                        if (
-                            not LindbladMPOSolver.is_float(g_tuple[0])
-                            or not isinstance(g_tuple[1], str)
-                            or not LindbladMPOSolver._is_int(g_tuple[2])
-                            or (
-                                tuple_len > 3
-                                and not LindbladMPOSolver._is_int(g_tuple[3])
-                            )
-                        ):
-                            check_msg += (
-                                "Error 347: each member of "
-                                + key
-                                + " must be a tuple of the form"
-                                " (time, gate name, qubit, [qubit])\n"
-                            )
-                            continue
-                else:  # Hence key == "custom_observables"
-                    for g_tuple in custom_list:
-                        tuple_len = len(g_tuple)
-                        if (
-                            tuple_len != 2
-                            or not isinstance(g_tuple[0], tuple)
-                            or len(g_tuple[0]) != 2
-                            or not isinstance(g_tuple[1], list)
-                        ):
-                            check_msg += (
-                                "Error 341: every member of "
-                                + key
-                                + " must be a 2-tuple of a 2-tuple and a list\n"
-                            )
-                            continue
-                        obs_type = g_tuple[0][1]
-                        if not isinstance(g_tuple[0][0], str) or (
-                            obs_type != "g" and obs_type != "p"
-                        ):
-                            check_msg += (
-                                "Error 342: each member of the first element of"
-                                + key
-                                + " must be a tuple of the form"
-                                " (obs_name, obs_type), with obs_type being either 'g' or"
-                                " 'p' to indicate a gate-based observable or a Pauli expansion\n"
-                            )
-                            continue
-                        for o_tuple in g_tuple[1]:
-                            # tuple_len = len(o_tuple)
-                            if obs_type == "g" and (
-                                not isinstance(o_tuple[0], str)
-                                or not LindbladMPOSolver._is_int(o_tuple[1])
-                            ):
-                                check_msg += (
-                                    "Error 343: each member of gate-based component of"
-                                    + key
-                                    + " must be a tuple of the form"
-                                    " (gate_name, q0, q1, ...)\n"
-                                )
-                                continue
-                            if obs_type == "p" and (
-                                not isinstance(o_tuple[0], str)
-                                or not LindbladMPOSolver.is_float(o_tuple[1])
-                            ):
-                                check_msg += (
-                                    "Error 343: each member of Pauli-based component of"
-                                    + key
-                                    + " must be a tuple of the form"
-                                    " (pauli-string, weight)\n"
-                                )
-                                continue
-
-            elif (key == "init_pauli_state") or (key == "init_product_state"):
-                if (
-                    not isinstance(parameters[key], (str, float, tuple))
-                    and not isinstance(parameters[key], list)
-                    and not isinstance(parameters[key], np.ndarray)
-                ):
-                    check_msg += (
-                        "Error 350: "
-                        + key
-                        + " must be a string, float, tuple or a list/ array of strings/floats/tuples\n"
-                    )
-                    continue
-                init_list = (
-                    [parameters[key]]
-                    if isinstance(parameters[key], (str, float, tuple))
-                    else parameters[key]
-                )
-                for q_init in init_list:
-                    if isinstance(q_init, (float, int)) or (
-                        isinstance(q_init, tuple) and len(q_init) == 1
-                    ):
-                        val = q_init[0] if isinstance(q_init, tuple) else q_init
-                        if (
-                            not LindbladMPOSolver.is_float(val)
-                            or not isfinite(val)
-                            or val < 0.0
-                            or val > 1.0
-                        ):
-                            check_msg += (
-                                "Error 361: a float or a length-1 tuple member of "
-                                + key
-                                + " represents a probability and must be between 0 and 1\n"
-                            )
-                        continue
-                    if isinstance(q_init, tuple):
-                        for val in q_init:
-                            if not LindbladMPOSolver.is_float(val) or not isfinite(val):
-                                check_msg += (
-                                    "Error 362: the values in a tuple member of "
-                                    + key
-                                    + " must be valid numbers\n"
-                                )
-                        if len(q_init) == 2:
-                            if q_init[0] < 0 or q_init[0] > np.pi:
-                                check_msg += (
-                                    "Error 363: the first value in a length-2 tuple of "
-                                    + key
-                                    + " represents a polar angle and must be in the range 0 to pi\n"
-                                )
-                        elif len(q_init) == 3:
-                            if not (
-                                0 <= q_init[0] <= 1
-                                and -1 <= q_init[1] <= 1
-                                and -1 <= q_init[2] <= 1
-                            ):
-                                check_msg += (
-                                    "Error 364: a tuple member of "
-                                    + key
-                                    + " with three elements must contain valid entries of a"
-                                    " density matrix\n"
-                                )
-                        else:
-                            check_msg += (
-                                "Error 365: a tuple member of "
-                                + key
-                                + " must be of 1, 2, or 3 elements\n"
-                            )
-                        continue
-                    if not isinstance(q_init, str):
-                        check_msg += (
-                            "Error 360: each member of "
-                            + key
-                            + " must be a string, a float, or a tuple\n"
-                        )
-                        continue
-                    allowed_init = ["+x", "-x", "+y", "-y", "+z", "-z", "id"]
-                    if q_init.lower() not in allowed_init:
-                        check_msg += (
-                            "Error 370: "
-                            + key
-                            + " can only be one of: +x, -x, +y, -y, +z, -z, id\n"
-                        )
-                        continue
-            elif (
-                (key == "b_periodic_x")
-                or (key == "b_periodic_y")
-                or (key == "b_force_rho_trace")
-                or (key == "b_unique_id")
-                or (key == "b_quiet")
-                or (key == "b_save_final_state")
-                or (key == "b_initial_rho_compression")
-                or (key == "b_apply_gate_compression")
-            ):
-                if not isinstance(parameters[key], bool):
-                    check_msg += (
-                        "Error 390: " + key + " should be a boolean True or False\n"
-                    )
-                    continue
-            elif key == "trotter_order":
-                if not LindbladMPOSolver._is_int(parameters[key]):
-                    check_msg += "Error 400: " + key + " should be 2, 3 or 4\n"
-                    continue
-                if (
-                    (parameters[key] != 2)
-                    and (parameters[key] != 3)
-                    and (parameters[key] != 4)
-                ):
-                    check_msg += "Error 401: " + key + " should be 2, 3 or 4\n"
-                    continue
-            elif key == "max_dim_rho":  # int
-                if (
-                    not LindbladMPOSolver._is_int(parameters[key])
-                    or parameters[key] < 0
-                ):
-                    check_msg += (
-                        "Error 410: " + key + " must be a non-negative integer\n"
-                    )
-                    continue
-            elif (key == "cut_off") or (key == "cut_off_rho"):
-                if not LindbladMPOSolver.is_float(parameters[key]):
-                    check_msg += "Error 420: " + key + " is not a float\n"
-                    continue
-            elif key == "metadata":
-                if not isinstance(parameters[key], str):
-                    check_msg += "Error 422: " + key + " is not a string\n"
-                    continue
-                if "\n" in parameters[key]:
-                    check_msg += (
-                        "Error 423: "
-                        "The metadata string cannot contain the new line "
-                        "character code ('\\n'). Please reformat the string\n"
-                    )
-                    continue
-            elif key == "load_files_prefix" or key == "output_files_prefix":
-                if not isinstance(parameters[key], str):
-                    check_msg += "Error 425: " + key + " is not a string\n"
-                    continue
-            elif key == "1q_components":
-                x_c = 0
-                y_c = 0
-                z_c = 0
-                if not isinstance(parameters[key], list):
-                    check_msg += (
-                        "Error 430: "
-                        + key
-                        + " should be a list of size 1,2,3 with x,y,z\n"
-                    )
-                    continue
-                if len(parameters[key]) > 3:
-                    check_msg += (
-                        "Error 440: "
-                        + key
-                        + " should be a list of size 1,2,3 with x,y,z\n"
-                    )
-                    continue
-                for val in parameters[key]:
-                    if not isinstance(val, str):
-                        check_msg += (
-                            "Error 441: " + key + " only takes x,y,z (or a subset)\n"
-                        )
-                        flag_continue = True
-                        break
-                    val = str.lower(val)
-                    if val == "x":
-                        x_c += 1
-                    elif val == "y":
-                        y_c += 1
-                    elif val == "z":
-                        z_c += 1
-                    else:
-                        check_msg += (
-                            "Error 450: " + key + " only takes x,y,z (or a subset)\n"
-                        )
-                        flag_continue = True
-                        break
-                if flag_continue:
-                    continue
-                if (x_c > 1) or (y_c > 1) or (z_c > 1):
-                    check_msg += (
-                        "Error 460: " + key + " only takes x,y,z (or a subset)\n"
-                    )
-                    continue
-            elif key == "1q_indices":
-                if parameters[key] != "":
-                    if not isinstance(parameters[key], list):
-                        check_msg += (
-                            "Error 470: "
-                            + key
-                            + " should be an integer list (1,2,3,4..)\n"
-                        )
-                        continue
-                    if N == -1:
-                        check_msg += (
-                            "Error 480: " + key + "could not be validated because 'N'"
-                            " (or alternatively l_x,"
-                            " l_y) are not defined properly\n "
-                        )
-                        continue
-                    for element in parameters[key]:
-                        if not LindbladMPOSolver._is_int(element):
-                            check_msg += (
-                                "Error 490: "
-                                + key
-                                + " should be an integer list (1,2,3,4..)\n"
-                            )
-                            flag_continue = True
-                            break
-                        if element >= N:
-                            check_msg += (
-                                "Error 500: "
-                                + key
-                                + " should be an integer list listing "
-                                "qubits, therefore integers in the "
-                                "range 0 to N-1\n"
-                            )
-                            flag_continue = True
-                            break
-                    if flag_continue:
-                        continue
-                    if len(parameters[key]) > N:
-                        check_msg += (
-                            "Error 510: "
-                            + key
-                            + " 's length should be equal/smaller than "
-                            "the amount of qubits\n "
-                        )
-                        continue
-                    if not len(set(parameters[key])) == len(parameters[key]):
-                        check_msg += (
-                            "Error 520: "
-                            + key
-                            + " 's List does not contain unique elements"
-                        )
-                        continue
-            elif key == "2q_components":
-                if not isinstance(parameters[key], list):
-                    check_msg += (
-                        "Error 530: "
-                        + key
-                        + "only accepts xx,yy,zz,xy,xz,yz (or a subset) "
-                        "as a strings list\n"
-                    )
-                    continue
-                if len(parameters[key]) > 6:
-                    check_msg += (
-                        "Error 540: "
-                        + key
-                        + " only accepts xx,yy,zz,xy,xz,yz (or a subset)\n"
-                    )
-                    continue
-                check_me = [0, 0, 0, 0, 0, 0, 0, 0, 0]
-                for val in parameters[key]:
-                    val = str.lower(val)
-                    if val == "xx":
-                        check_me[0] += 1
-                    elif val == "yy":
-                        check_me[1] += 1
-                    elif val == "zz":
-                        check_me[2] += 1
-                    elif val == "xy":
-                        check_me[3] += 1
-                    elif val == "xz":
-                        check_me[4] += 1
-                    elif val == "yz":
-                        check_me[5] += 1
-                    elif val == "yx":
-                        check_me[6] += 1
-                    elif val == "zx":
-                        check_me[7] += 1
-                    elif val == "zy":
-                        check_me[8] += 1
-                    else:
-                        check_msg += (
-                            "Error 550: "
-                            + key
-                            + " only accepts string from xx, yy, zz, xy, "
-                            "xz, yz (or a permutation thereof)\n"
-                        )
-                        flag_continue = True
-                        break
-                if flag_continue:
-                    continue
-                for check_val in check_me:
-                    if check_val > 1:
-                        check_msg += (
-                            "Error 550: "
-                            + key
-                            + " only accepts strings from xx, yy, zz, xy, "
-                            "xz, yz (or a permutation thereof)\n"
-                        )
-                        flag_continue = True
-                        break
-                if flag_continue:
-                    continue
-            elif key == "3q_components":
-                if not isinstance(parameters[key], list):
-                    check_msg += (
-                        "Error 530: "
-                        + key
-                        + "only accepts xx,yy,zz,xy,xz,yz (or a subset) "
-                        "as a strings list\n"
-                    )
-                    continue
-                for val in parameters[key]:
-                    val = str.lower(val)
-                    b_ok = True
-                    if len(val) != 3:
-                        b_ok = False
-                    else:
-                        for c in val:
-                            if c not in "xyz":
-                                b_ok = False
-                                break
-                    if not b_ok:
-                        check_msg += (
-                            "Error 531: "
-                            + key
-                            + "only accepts length-3 Pauli strings\n"
-                        )
-                        flag_continue = True
-                        break
-                if flag_continue:
-                    continue
-            elif (
-                key == "2q_indices"
-                or key == "3q_indices"
-                or key == "init_graph_state"
-                or key == "init_cz_gates"
-            ):  # expecting an integer tuples list
-                if not isinstance(parameters[key], list):
-                    check_msg += (
-                        "Error 570: " + key + " should be a list of tuples"
-                        " containing integers\n"
-                    )
-                    continue
-                if N == -1:
-                    check_msg += (
-                        "Error 580: " + key + " could not be validated because 'N' "
-                        "(or alternatively l_x, "
-                        "l_y) are not defined properly\n"
-                    )
-                    continue
-                tup_len = 3 if key == "3q_indices" else 2
-                for tup in parameters[key]:
-                    if not isinstance(tup, tuple):
-                        check_msg += (
-                            "Error 590: "
-                            + key
-                            + " should be a list of tuples containing integers\n "
-                        )
-                        flag_continue = True
-                        break
-                    if (
-                        (len(tup) != tup_len)
-                        or (not LindbladMPOSolver._is_int(tup[0]))
-                        or (not LindbladMPOSolver._is_int(tup[1]))
-                        or (tup_len == 3 and not LindbladMPOSolver._is_int(tup[2]))
-                    ):
-                        check_msg += (
-                            "Error 600: "
-                            + key
-                            + f" should be a list of tuples of size {tup_len}, "
-                            "containing integers\n "
-                        )
-                        flag_continue = True
-                        break
-                    if (tup[0] >= N) or (tup[1] >= N) or (tup_len == 3 and tup[2] >= N):
-                        check_msg += (
-                            "Error 610: "
-                            + key
-                            + f" should be a list of tuples of size {tup_len}, "
-                            "containing integers equal to or smaller than "
-                            "the total number of qubits\n "
-                        )
-                        flag_continue = True
-                        break
-                if flag_continue:
-                    continue
-                if not len(set(parameters[key])) == len(parameters[key]):
-                    check_msg += "Error 630: " + key + " contains duplicate elements\n"
-                    continue
-            elif ignore_params is None or key not in ignore_params:
-                check_msg += "Error: unknown parameter key passed: " + key + "\n"
-        # End of: "for key in dict.keys(parameters)"
+            handler = _PARAM_HANDLERS.get(key)
+            if handler is None:
+                if ignore_params is None or key not in ignore_params:
+                    check_msg += "Error: unknown parameter key passed: " + key + "\n"
+                continue
+            check_msg += handler(key, value, parameters)
+        # End of: "for key, value in parameters.items()"
 
         # More cross-parameter checks:
         if ("t_final" in parameters) and ("tau" in parameters):
@@ -1221,4 +812,732 @@ class LindbladMPOSolver:
                                         "than t_final (output_step in units of tau, times "
                                         "tau is larger than the simulation time)\n "
                                     )
+        if check_msg == "" and s_digest is not None:
+            verify_cache[s_digest] = True
+            while len(verify_cache) > LindbladMPOSolver.VERIFY_CACHE_MAX_SIZE:
+                verify_cache.popitem(last=False)
         return check_msg
+
+
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+"""Whether the optional numba package is available to accelerate the output parse."""
+
+_parse_rows_numba = None
+"""The JIT-compiled output-row parser, compiled on first use (False if disabled
+after a failed import, compilation or invocation)."""
+
+
+def _numba_parse_rows():
+    """Returns the JIT-compiled output-row parser, or None if numba is unavailable.
+
+    The parser walks the raw bytes of an output data file, tokenizing each line and
+    converting the time, qubit-index and value columns in native code. It converts
+    only decimal literals whose binary conversion is exactly rounded with a single
+    float operation, and reports failure otherwise, in which case the caller falls
+    back to the numpy text parse.
+    """
+    global _parse_rows_numba
+    if not _HAS_NUMBA:
+        return None
+    if _parse_rows_numba is None:
+        try:
+            import numba
+        except Exception:  # pylint: disable=broad-except
+            # A broken numba installation must not break parsing.
+            _parse_rows_numba = False
+            return None
+
+        @numba.njit
+        def parse_int(buf, i_start, i_end):
+            i = i_start
+            b_neg = False
+            if i < i_end and (buf[i] == 43 or buf[i] == 45):  # '+', '-'
+                b_neg = buf[i] == 45
+                i += 1
+            value = 0
+            n_digits = 0
+            while i < i_end and 48 <= buf[i] <= 57:
+                value = value * 10 + (buf[i] - 48)
+                n_digits += 1
+                i += 1
+            if n_digits == 0 or n_digits > 18 or i != i_end:
+                return 0, False
+            return (-value if b_neg else value), True
+
+        @numba.njit
+        def parse_float(buf, i_start, i_end):
+            i = i_start
+            b_neg = False
+            if i < i_end and (buf[i] == 43 or buf[i] == 45):  # '+', '-'
+                b_neg = buf[i] == 45
+                i += 1
+            mant = 0
+            n_digits = 0
+            exp10 = 0
+            while i < i_end and 48 <= buf[i] <= 57:
+                mant = mant * 10 + (buf[i] - 48)
+                n_digits += 1
+                i += 1
+            if i < i_end and buf[i] == 46:  # '.'
+                i += 1
+                while i < i_end and 48 <= buf[i] <= 57:
+                    mant = mant * 10 + (buf[i] - 48)
+                    exp10 -= 1
+                    n_digits += 1
+                    i += 1
+            if n_digits == 0 or n_digits > 18:
+                return 0.0, False
+            if i < i_end and (buf[i] == 101 or buf[i] == 69):  # 'e', 'E'
+                i += 1
+                b_exp_neg = False
+                if i < i_end and (buf[i] == 43 or buf[i] == 45):
+                    b_exp_neg = buf[i] == 45
+                    i += 1
+                exp_val = 0
+                n_exp_digits = 0
+                while i < i_end and 48 <= buf[i] <= 57:
+                    exp_val = exp_val * 10 + (buf[i] - 48)
+                    n_exp_digits += 1
+                    i += 1
+                if n_exp_digits == 0:
+                    return 0.0, False
+                exp10 += -exp_val if b_exp_neg else exp_val
+            if i != i_end:
+                return 0.0, False
+            # The conversion below is exactly rounded only while the mantissa and the
+            # power of ten are exactly representable; bail out otherwise.
+            if mant >= 2**53 or exp10 > 22 or exp10 < -22:
+                return 0.0, False
+            if exp10 < 0:
+                value = mant / 10.0 ** (-exp10)
+            else:
+                value = mant * 10.0**exp10
+            return (-value if b_neg else value), True
+
+        @numba.njit
+        def parse_rows(buf, n_index_cols, t_arr, val_arr, q_arr, op_bounds):
+            n = buf.shape[0]
+            n_tokens_expected = 3 + n_index_cols
+            starts = np.empty(n_tokens_expected, np.int64)
+            ends = np.empty(n_tokens_expected, np.int64)
+            i = 0
+            n_rows = 0
+            while i < n:
+                i_eol = i
+                while i_eol < n and buf[i_eol] != 10:  # '\n'
+                    i_eol += 1
+                k = i
+                while k < i_eol and (buf[k] == 32 or buf[k] == 9 or buf[k] == 13):
+                    k += 1
+                if k >= i_eol or buf[k] == 35:  # blank line or '#' comment
+                    i = i_eol + 1
+                    continue
+                n_tokens = 0
+                while k < i_eol:
+                    if n_tokens == n_tokens_expected:
+                        return -1
+                    starts[n_tokens] = k
+                    while k < i_eol and buf[k] != 32 and buf[k] != 9 and buf[k] != 13:
+                        k += 1
+                    ends[n_tokens] = k
+                    n_tokens += 1
+                    while k < i_eol and (buf[k] == 32 or buf[k] == 9 or buf[k] == 13):
+                        k += 1
+                if n_tokens != n_tokens_expected:
+                    return -1
+                t, b_ok = parse_float(buf, starts[0], ends[0])
+                if not b_ok:
+                    return -1
+                val, b_ok = parse_float(buf, starts[n_tokens - 1], ends[n_tokens - 1])
+                if not b_ok:
+                    return -1
+                for i_col in range(n_index_cols):
+                    q, b_ok = parse_int(buf, starts[2 + i_col], ends[2 + i_col])
+                    if not b_ok:
+                        return -1
+                    # Data files are storing 1-based indices because of iTensor,
+                    # while we use 0-based indices:
+                    q_arr[n_rows, i_col] = q - 1
+                t_arr[n_rows] = t
+                val_arr[n_rows] = val
+                op_bounds[n_rows, 0] = starts[1]
+                op_bounds[n_rows, 1] = ends[1]
+                n_rows += 1
+                i = i_eol + 1
+            return n_rows
+
+        _parse_rows_numba = parse_rows
+    return _parse_rows_numba or None
+
+
+# The per-parameter validators below implement the checks of verify_parameters().
+# Each handler returns a (possibly empty) error-message string for one key, and
+# _PARAM_HANDLERS maps every recognized parameter name to its handler, so that
+# the verification loop dispatches with a single dict lookup per key.
+
+_ALLOWED_INIT = frozenset(("+x", "-x", "+y", "-y", "+z", "-z", "id"))
+"""The allowed string values of a qubit initial state."""
+
+_ALLOWED_1Q_COMPONENTS = frozenset(("x", "y", "z"))
+"""The allowed one-qubit observable components."""
+
+_ALLOWED_2Q_COMPONENTS = frozenset(
+    ("xx", "yy", "zz", "xy", "xz", "yz", "yx", "zx", "zy")
+)
+"""The allowed two-qubit observable components."""
+
+
+def _check_n_qubits(key: str, value, parameters: dict) -> str:
+    """Validates the number of qubits parameter."""
+    if not LindbladMPOSolver._is_int(value):
+        return "Error 120: " + key + " should be an integer\n"
+    if value <= 0:
+        return "Error 130: " + key + " should be bigger/equal to 1 (integer)\n"
+    return ""
+
+
+def _check_time_scalar(key: str, value, parameters: dict) -> str:
+    """Validates one of the scalar time parameters (t_init, t_final, tau)."""
+    if not LindbladMPOSolver.is_float(value):
+        return "Error 140: " + key + " is not a float\n"
+    if key != "t_init" and value <= 0:
+        return "Error 150: " + key + " must be larger than 0\n"
+    if key == "t_init" and value > parameters["t_final"]:
+        return "Error 151: " + key + " must be equal or smaller than t_final\n"
+    return ""
+
+
+def _check_lattice_dim(key: str, value, parameters: dict) -> str:
+    """Validates a lattice dimension parameter (l_x, l_y)."""
+    if not LindbladMPOSolver._is_int(value):
+        return "Error 160: " + key + " should be an integer\n"
+    if value < 0:
+        return "Error 170: " + key + " should be equal to or larger than 0 (integer)\n"
+    return ""
+
+
+def _check_step_int(key: str, value, parameters: dict) -> str:
+    """Validates a non-negative integer step parameter."""
+    if not LindbladMPOSolver._is_int(value):
+        return "Error 180: " + key + " should be an integer\n"
+    if value < 0:
+        return "Error 190: " + key + " should be equal to or larger than 0 (integer)\n"
+    return ""
+
+
+def _check_float_or_n_vector(key: str, value, parameters: dict) -> str:
+    """Validates a parameter given as a float or an N-length vector of floats."""
+    if LindbladMPOSolver.is_float(value):
+        return ""
+    N = LindbladMPOSolver._get_number_of_qubits(parameters)
+    if N == -1:
+        return (
+            "Error 200: " + key + " could not be validated because 'N' "
+            "(or alternatively l_x, l_y) are not "
+            "defined properly\n "
+        )
+    if isinstance(value, list):
+        if len(value) != N:
+            return (
+                "Error 210: " + key + " is not a float / N-length list / "
+                "numpy array (of floats)\n"
+            )
+        # One vectorized dtype check replaces per-element isinstance calls.
+        arr = LindbladMPOSolver._as_numeric_array(value)
+        if arr is None or arr.ndim != 1:
+            return (
+                "Error 220: " + key + "is not a float / N-length list "
+                "/ numpy array (of floats)\n "
+            )
+        return ""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind not in "iuf":
+            return (
+                "Error 230: " + key + " is not a float / N-length list / "
+                "numpy array (of floats)\n"
+            )
+        if value.size == 1:
+            return ""
+        if (value.shape[0] != N) or (value.shape[0] != value.size):
+            return (
+                "Error 240: " + key + " is not a float / N-length list / "
+                "numpy array (of floats)\n"
+            )
+        return ""
+    return (
+        "Error 250: " + key + " is not a float / N-length list / numpy "
+        "array (of floats)\n"
+    )
+
+
+def _check_coupling_matrix(key: str, value, parameters: dict) -> str:
+    """Validates a coupling parameter given as a float or an (N, N) matrix of floats."""
+    if LindbladMPOSolver.is_float(value):
+        return ""
+    N = LindbladMPOSolver._get_number_of_qubits(parameters)
+    if N == -1:
+        return (
+            "Error 260: " + key + " could not be validated because 'N' "
+            "(or alternatively l_x, l_y) are not "
+            "defined properly\n"
+        )
+    if isinstance(value, list):
+        if len(value) != N:
+            return (
+                "Error 270: " + key + " should be a constant, or a square matrix"
+                " (nested lists/np.array) of N^2 floats\n "
+            )
+        # One vectorized conversion and shape check replaces the per-element
+        # isinstance scan; the row walk below only runs to diagnose a failure.
+        arr = LindbladMPOSolver._as_numeric_array(value)
+        if arr is not None and arr.shape == (N, N):
+            return ""
+        for lst in value:
+            if not isinstance(lst, list):
+                return (
+                    "Error 280: " + key + "should be a constant, or a square "
+                    "matrix (nested lists/np.array) of "
+                    "floats with a size N^2\n "
+                )
+            if len(lst) != N:
+                return (
+                    "Error 290: "
+                    + key
+                    + "should be a constant, or a square matrix (nested "
+                    "lists/np.array) with N^2 floats\n"
+                )
+        return (
+            "Error 300: " + key + "should be a constant, or a square matrix (nested "
+            "lists/np.array) in the size of number_of_qubits^2 "
+            "of floats\n"
+        )
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind not in "iuf":
+            return (
+                "Error 310: "
+                + key
+                + "should be a constant, or a square matrix (nested "
+                "lists/np.array) in the size of number_of_qubits^2 of "
+                "floats\n"
+            )
+        if value.size == 1:
+            return ""
+        if value.shape[0] != N:
+            return (
+                "Error 320: "
+                + key
+                + "should be a constant, or a square matrix (nested "
+                "lists/np.array) in the size of number_of_qubits^2 of "
+                "floats\n"
+            )
+        if value.shape[0] ** 2 != value.size:
+            return (
+                "Error 330: "
+                + key
+                + "should be a constant, or a square matrix (nested "
+                "lists/np.array) in the size of number_of_qubits^2 of "
+                "floats\n"
+            )
+        return ""
+    return (
+        "Error 340: " + key + " should be a constant, or a square matrix (nested "
+        "list/np.array) in the size of number_of_qubits^2 of floats\n"
+    )
+
+
+def _check_gates_and_observables(key: str, value, parameters: dict) -> str:
+    """Validates the apply_gates and custom_observables tuple lists."""
+    if (
+        not isinstance(value, tuple)
+        and not isinstance(value, list)
+        and not isinstance(value, np.ndarray)
+    ):
+        return "Error 345: " + key + " must be a tuple or a list/ array of tuples\n"
+    msg = ""
+    custom_list = [value] if isinstance(value, tuple) else value
+    if key == "apply_gates":
+        for g_tuple in custom_list:
+            tuple_len = len(g_tuple)
+            if tuple_len < 3 or tuple_len > 4:
+                msg += (
+                    "Error 346: every member of "
+                    + key
+                    + " must be of 3 or 4 elements\n"
+                )
+                continue
+            if (
+                not LindbladMPOSolver.is_float(g_tuple[0])
+                or not isinstance(g_tuple[1], str)
+                or not LindbladMPOSolver._is_int(g_tuple[2])
+                or (tuple_len > 3 and not LindbladMPOSolver._is_int(g_tuple[3]))
+            ):
+                msg += (
+                    "Error 347: each member of " + key + " must be a tuple of the form"
+                    " (time, gate name, qubit, [qubit])\n"
+                )
+                continue
+    else:  # Hence key == "custom_observables"
+        for g_tuple in custom_list:
+            tuple_len = len(g_tuple)
+            if (
+                tuple_len != 2
+                or not isinstance(g_tuple[0], tuple)
+                or len(g_tuple[0]) != 2
+                or not isinstance(g_tuple[1], list)
+            ):
+                msg += (
+                    "Error 341: every member of "
+                    + key
+                    + " must be a 2-tuple of a 2-tuple and a list\n"
+                )
+                continue
+            obs_type = g_tuple[0][1]
+            if not isinstance(g_tuple[0][0], str) or (
+                obs_type != "g" and obs_type != "p"
+            ):
+                msg += (
+                    "Error 342: each member of the first element of"
+                    + key
+                    + " must be a tuple of the form"
+                    " (obs_name, obs_type), with obs_type being either 'g' or"
+                    " 'p' to indicate a gate-based observable or a Pauli expansion\n"
+                )
+                continue
+            for o_tuple in g_tuple[1]:
+                # tuple_len = len(o_tuple)
+                if obs_type == "g" and (
+                    not isinstance(o_tuple[0], str)
+                    or not LindbladMPOSolver._is_int(o_tuple[1])
+                ):
+                    msg += (
+                        "Error 343: each member of gate-based component of"
+                        + key
+                        + " must be a tuple of the form"
+                        " (gate_name, q0, q1, ...)\n"
+                    )
+                    continue
+                if obs_type == "p" and (
+                    not isinstance(o_tuple[0], str)
+                    or not LindbladMPOSolver.is_float(o_tuple[1])
+                ):
+                    msg += (
+                        "Error 343: each member of Pauli-based component of"
+                        + key
+                        + " must be a tuple of the form"
+                        " (pauli-string, weight)\n"
+                    )
+                    continue
+    return msg
+
+
+def _check_init_state(key: str, value, parameters: dict) -> str:
+    """Validates the init_pauli_state and init_product_state parameters."""
+    if (
+        not isinstance(value, (str, float, tuple))
+        and not isinstance(value, list)
+        and not isinstance(value, np.ndarray)
+    ):
+        return (
+            "Error 350: "
+            + key
+            + " must be a string, float, tuple or a list/ array of strings/floats/tuples\n"
+        )
+    msg = ""
+    init_list = [value] if isinstance(value, (str, float, tuple)) else value
+    for q_init in init_list:
+        if isinstance(q_init, (float, int)) or (
+            isinstance(q_init, tuple) and len(q_init) == 1
+        ):
+            val = q_init[0] if isinstance(q_init, tuple) else q_init
+            if (
+                not LindbladMPOSolver.is_float(val)
+                or not isfinite(val)
+                or val < 0.0
+                or val > 1.0
+            ):
+                msg += (
+                    "Error 361: a float or a length-1 tuple member of "
+                    + key
+                    + " represents a probability and must be between 0 and 1\n"
+                )
+            continue
+        if isinstance(q_init, tuple):
+            for val in q_init:
+                if not LindbladMPOSolver.is_float(val) or not isfinite(val):
+                    msg += (
+                        "Error 362: the values in a tuple member of "
+                        + key
+                        + " must be valid numbers\n"
+                    )
+            if len(q_init) == 2:
+                if q_init[0] < 0 or q_init[0] > np.pi:
+                    msg += (
+                        "Error 363: the first value in a length-2 tuple of "
+                        + key
+                        + " represents a polar angle and must be in the range 0 to pi\n"
+                    )
+            elif len(q_init) == 3:
+                if not (
+                    0 <= q_init[0] <= 1
+                    and -1 <= q_init[1] <= 1
+                    and -1 <= q_init[2] <= 1
+                ):
+                    msg += (
+                        "Error 364: a tuple member of "
+                        + key
+                        + " with three elements must contain valid entries of a"
+                        " density matrix\n"
+                    )
+            else:
+                msg += (
+                    "Error 365: a tuple member of "
+                    + key
+                    + " must be of 1, 2, or 3 elements\n"
+                )
+            continue
+        if not isinstance(q_init, str):
+            msg += (
+                "Error 360: each member of "
+                + key
+                + " must be a string, a float, or a tuple\n"
+            )
+            continue
+        if q_init.lower() not in _ALLOWED_INIT:
+            msg += (
+                "Error 370: "
+                + key
+                + " can only be one of: +x, -x, +y, -y, +z, -z, id\n"
+            )
+            continue
+    return msg
+
+
+def _check_bool_flag(key: str, value, parameters: dict) -> str:
+    """Validates a boolean flag parameter."""
+    if not isinstance(value, bool):
+        return "Error 390: " + key + " should be a boolean True or False\n"
+    return ""
+
+
+def _check_trotter_order(key: str, value, parameters: dict) -> str:
+    """Validates the Trotter order parameter."""
+    if not LindbladMPOSolver._is_int(value):
+        return "Error 400: " + key + " should be 2, 3 or 4\n"
+    if (value != 2) and (value != 3) and (value != 4):
+        return "Error 401: " + key + " should be 2, 3 or 4\n"
+    return ""
+
+
+def _check_max_dim_rho(key: str, value, parameters: dict) -> str:
+    """Validates the maximal density-matrix bond dimension parameter."""
+    if not LindbladMPOSolver._is_int(value) or value < 0:
+        return "Error 410: " + key + " must be a non-negative integer\n"
+    return ""
+
+
+def _check_cutoff_float(key: str, value, parameters: dict) -> str:
+    """Validates a truncation cutoff parameter."""
+    if not LindbladMPOSolver.is_float(value):
+        return "Error 420: " + key + " is not a float\n"
+    return ""
+
+
+def _check_metadata(key: str, value, parameters: dict) -> str:
+    """Validates the metadata string parameter."""
+    if not isinstance(value, str):
+        return "Error 422: " + key + " is not a string\n"
+    if "\n" in value:
+        return (
+            "Error 423: "
+            "The metadata string cannot contain the new line "
+            "character code ('\\n'). Please reformat the string\n"
+        )
+    return ""
+
+
+def _check_string(key: str, value, parameters: dict) -> str:
+    """Validates a string parameter (the file prefixes)."""
+    if not isinstance(value, str):
+        return "Error 425: " + key + " is not a string\n"
+    return ""
+
+
+def _check_1q_components(key: str, value, parameters: dict) -> str:
+    """Validates the one-qubit observable components parameter."""
+    if not isinstance(value, list):
+        return "Error 430: " + key + " should be a list of size 1,2,3 with x,y,z\n"
+    if len(value) > 3:
+        return "Error 440: " + key + " should be a list of size 1,2,3 with x,y,z\n"
+    lowered = []
+    for val in value:
+        if not isinstance(val, str):
+            return "Error 441: " + key + " only takes x,y,z (or a subset)\n"
+        val = str.lower(val)
+        if val not in _ALLOWED_1Q_COMPONENTS:
+            return "Error 450: " + key + " only takes x,y,z (or a subset)\n"
+        lowered.append(val)
+    if len(set(lowered)) != len(lowered):
+        return "Error 460: " + key + " only takes x,y,z (or a subset)\n"
+    return ""
+
+
+def _check_1q_indices(key: str, value, parameters: dict) -> str:
+    """Validates the one-qubit observable indices parameter."""
+    if not isinstance(value, list):
+        return "Error 470: " + key + " should be an integer list (1,2,3,4..)\n"
+    N = LindbladMPOSolver._get_number_of_qubits(parameters)
+    if N == -1:
+        return (
+            "Error 480: " + key + "could not be validated because 'N'"
+            " (or alternatively l_x,"
+            " l_y) are not defined properly\n "
+        )
+    for element in value:
+        if not LindbladMPOSolver._is_int(element):
+            return "Error 490: " + key + " should be an integer list (1,2,3,4..)\n"
+        if element >= N:
+            return (
+                "Error 500: " + key + " should be an integer list listing "
+                "qubits, therefore integers in the "
+                "range 0 to N-1\n"
+            )
+    if len(value) > N:
+        return (
+            "Error 510: " + key + " 's length should be equal/smaller than "
+            "the amount of qubits\n "
+        )
+    if not len(set(value)) == len(value):
+        return "Error 520: " + key + " 's List does not contain unique elements"
+    return ""
+
+
+def _check_2q_components(key: str, value, parameters: dict) -> str:
+    """Validates the two-qubit observable components parameter."""
+    if not isinstance(value, list):
+        return (
+            "Error 530: " + key + "only accepts xx,yy,zz,xy,xz,yz (or a subset) "
+            "as a strings list\n"
+        )
+    if len(value) > 6:
+        return "Error 540: " + key + " only accepts xx,yy,zz,xy,xz,yz (or a subset)\n"
+    lowered = []
+    for val in value:
+        val = str.lower(val)
+        if val not in _ALLOWED_2Q_COMPONENTS:
+            return (
+                "Error 550: " + key + " only accepts string from xx, yy, zz, xy, "
+                "xz, yz (or a permutation thereof)\n"
+            )
+        lowered.append(val)
+    if len(set(lowered)) != len(lowered):
+        return (
+            "Error 550: " + key + " only accepts strings from xx, yy, zz, xy, "
+            "xz, yz (or a permutation thereof)\n"
+        )
+    return ""
+
+
+def _check_3q_components(key: str, value, parameters: dict) -> str:
+    """Validates the three-qubit observable components parameter."""
+    if not isinstance(value, list):
+        return (
+            "Error 530: " + key + "only accepts xx,yy,zz,xy,xz,yz (or a subset) "
+            "as a strings list\n"
+        )
+    for val in value:
+        val = str.lower(val)
+        b_ok = True
+        if len(val) != 3:
+            b_ok = False
+        else:
+            for c in val:
+                if c not in "xyz":
+                    b_ok = False
+                    break
+        if not b_ok:
+            return "Error 531: " + key + "only accepts length-3 Pauli strings\n"
+    return ""
+
+
+def _check_index_tuple_list(key: str, value, parameters: dict) -> str:
+    """Validates a parameter expecting a list of integer tuples."""
+    if not isinstance(value, list):
+        return "Error 570: " + key + " should be a list of tuples containing integers\n"
+    N = LindbladMPOSolver._get_number_of_qubits(parameters)
+    if N == -1:
+        return (
+            "Error 580: " + key + " could not be validated because 'N' "
+            "(or alternatively l_x, "
+            "l_y) are not defined properly\n"
+        )
+    tup_len = 3 if key == "3q_indices" else 2
+    for tup in value:
+        if not isinstance(tup, tuple):
+            return (
+                "Error 590: "
+                + key
+                + " should be a list of tuples containing integers\n "
+            )
+        if (
+            (len(tup) != tup_len)
+            or (not LindbladMPOSolver._is_int(tup[0]))
+            or (not LindbladMPOSolver._is_int(tup[1]))
+            or (tup_len == 3 and not LindbladMPOSolver._is_int(tup[2]))
+        ):
+            return (
+                "Error 600: " + key + f" should be a list of tuples of size {tup_len}, "
+                "containing integers\n "
+            )
+        if (tup[0] >= N) or (tup[1] >= N) or (tup_len == 3 and tup[2] >= N):
+            return (
+                "Error 610: " + key + f" should be a list of tuples of size {tup_len}, "
+                "containing integers equal to or smaller than "
+                "the total number of qubits\n "
+            )
+    if not len(set(value)) == len(value):
+        return "Error 630: " + key + " contains duplicate elements\n"
+    return ""
+
+
+_PARAM_HANDLERS: Dict[str, Callable[[str, Any, dict], str]] = {
+    "N": _check_n_qubits,
+    "t_init": _check_time_scalar,
+    "t_final": _check_time_scalar,
+    "tau": _check_time_scalar,
+    "l_x": _check_lattice_dim,
+    "l_y": _check_lattice_dim,
+    "output_step": _check_step_int,
+    "force_rho_hermitian_step": _check_step_int,
+    "apply_gates": _check_gates_and_observables,
+    "custom_observables": _check_gates_and_observables,
+    "init_pauli_state": _check_init_state,
+    "init_product_state": _check_init_state,
+    "trotter_order": _check_trotter_order,
+    "max_dim_rho": _check_max_dim_rho,
+    "cut_off": _check_cutoff_float,
+    "cut_off_rho": _check_cutoff_float,
+    "metadata": _check_metadata,
+    "load_files_prefix": _check_string,
+    "output_files_prefix": _check_string,
+    "1q_components": _check_1q_components,
+    "1q_indices": _check_1q_indices,
+    "2q_components": _check_2q_components,
+    "3q_components": _check_3q_components,
+}
+for _key in ("h_x", "h_y", "h_z", "g_0", "g_1", "g_2"):
+    _PARAM_HANDLERS[_key] = _check_float_or_n_vector
+for _key in ("J", "J_z"):
+    _PARAM_HANDLERS[_key] = _check_coupling_matrix
+for _key in ("2q_indices", "3q_indices", "init_graph_state", "init_cz_gates"):
+    _PARAM_HANDLERS[_key] = _check_index_tuple_list
+for _key in (
+    "b_periodic_x",
+    "b_periodic_y",
+    "b_force_rho_trace",
+    "b_unique_id",
+    "b_quiet",
+    "b_save_final_state",
+    "b_initial_rho_compression",
+    "b_apply_gate_compression",
+):
+    _PARAM_HANDLERS[_key] = _check_bool_flag
@@ -10,6 +10,8 @@
 Routines for basic plotting of simulation results, with both general and more specialized functions.
 """
 
+import functools
+import importlib.util
 from typing import Optional, Tuple, List, Union, Any, Sequence, Dict
 
 from mpl_toolkits.axes_grid1 import make_axes_locatable
@@ -17,6 +19,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 import scipy
 
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+"""Whether the optional numba package is available for accelerating array kernels."""
+
 
 LINDBLADMPO_TEX_LABELS = {
     "tr_rho": "{\\rm tr}\\rho",
@@ -33,11 +38,17 @@ LINDBLADMPO_LINE_STYLES = ["-", "--", ":", "-."]
 """Line styles for curves plotted using matplotlib"""
 
 
-def _save_fig(b_save_figures, s_file_prefix, s_file_label):
+def _save_fig(b_save_figures, s_file_prefix, s_file_label, ax=None, b_close=False):
     if b_save_figures:
         if s_file_prefix != "":
             s_file_label = "." + s_file_label
-        plt.savefig(s_file_prefix + s_file_label + ".png")
+        # Save through the figure object, avoiding the implicit current-figure
+        # lookup of plt.savefig (which can also target the wrong figure when the
+        # caller plots onto an externally created axis).
+        fig = ax.get_figure() if ax is not None else plt.gcf()
+        fig.savefig(s_file_prefix + s_file_label + ".png")
+        if b_close:
+            plt.close(fig)
 
 
 def prepare_time_data(
@@ -64,32 +75,78 @@ def prepare_time_data(
                     t_tick_indices: The indices of the time axis tick marks.
                     t_tick_labels: The formatted labels of the time axis tick marks.
                     n_t_steps: The number of time steps
+
+    The returned arrays are cached (the many plot functions of one simulation all recompute
+    the same time data), and are therefore marked as read-only.
     """
     tau = parameters["tau"]
     if t_final is None:
         t_final = parameters["t_final"]
     if t_init is None:
         t_init = parameters.get("t_init", 0.0)
+    return _prepare_time_data(tau, t_init, t_final, n_t_ticks, t_ticks_round)
+
+
+@functools.lru_cache(maxsize=32)
+def _prepare_time_data(
+    tau: float, t_init: float, t_final: float, n_t_ticks: int, t_ticks_round: int
+) -> (np.ndarray, np.ndarray, np.ndarray, int):
+    """Compute and cache the time data of `prepare_time_data` from its scalar arguments."""
     # output_step = parameters.get('output_step', 1)
     # TODO handle output_step
-    n_t_steps = int((t_final - t_init) / (tau * 1)) + 1
-    t_tick_indices = np.arange(0, n_t_steps, int(n_t_steps / n_t_ticks))
-    # TODO: Fix division by zero when n_t_ticks < n_t_steps above
-    t_eval = np.arange(t_init, t_final, tau)
-    if t_final not in t_eval:
-        t_eval = np.concatenate((t_eval, [t_final]))
+    # Round the number of steps (rather than truncate), and build the time array by
+    # multiplying the step index - this keeps the endpoint present by construction,
+    # where np.arange(t_init, t_final, tau) could lose it to float drift.
+    n_t_steps = int(round((t_final - t_init) / tau)) + 1
+    t_eval = t_init + tau * np.arange(n_t_steps)
+    t_tick_indices = np.linspace(0, n_t_steps - 1, n_t_ticks, dtype=np.int64)
     if t_ticks_round == 0:
         t_tick_labels = np.asarray(t_init + t_tick_indices * tau, dtype=int)
     else:
         t_tick_labels = np.round(t_init + t_tick_indices * tau, t_ticks_round)
+    for arr in (t_eval, t_tick_indices, t_tick_labels):
+        arr.setflags(write=False)
     return t_eval, t_tick_indices, t_tick_labels, n_t_steps
 
 
+def _t_index(times_arr, t: float) -> Optional[int]:
+    """Locate the index of time `t` in a sorted time array with a binary search.
+
+    The match uses a tight relative tolerance rather than float equality, so a
+    time that drifted by a few ulps from the grid point is still found.
+
+    Args:
+            times_arr: A sorted array (or list) of time points.
+            t: The time to locate.
+
+    Returns:
+            The index of `t` in the array, or None if `t` is not on the time grid.
+    """
+    times_arr = np.asarray(times_arr)
+    n_times = len(times_arr)
+    if n_times == 0:
+        return None
+    i_t = int(np.searchsorted(times_arr, t))
+    for i_candidate in (i_t - 1, i_t):
+        if 0 <= i_candidate < n_times and np.isclose(
+            times_arr[i_candidate], t, rtol=1e-9, atol=0.0
+        ):
+            return i_candidate
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _sigma_1q_label(s_obs_name: str, qubit: int) -> str:
+    """Formats (and caches) the tex label of a single-qubit observable."""
+    return f"\\sigma^{s_obs_name}_{{{qubit}}}"
+
+
 def prepare_curve_data(
     result: dict,
     s_output_type: str,
     s_obs_name: str,
     q_indices: Union[Tuple, Tuple[int]],
+    build_label=True,
 ) -> (Tuple[List, List], str):
     """
     Prepare the data used for plotting one curve of simulation observables.
@@ -102,6 +159,8 @@ def prepare_curve_data(
                     dict, and also in formatting the descriptive tex label of the data.
             q_indices: A tuple with the indices of the qubits identifying the observable to plot, or
                     an empty tuple if the observable is a global one.
+            build_label: Whether to format the tex label. Callers that discard the label can
+                    pass False to skip the string formatting.
 
     Returns:
             A tuple with the following two entries:
@@ -115,8 +174,10 @@ def prepare_curve_data(
     s_obs_name = s_obs_name.lower()
     if obs_dict is not None:
         obs_data = obs_dict.get((s_obs_name, q_indices))
-        if s_output_type == "obs-1q":
-            s_tex_label = f"\\sigma^{s_obs_name}_{{{q_indices[0]}}}"
+        if not build_label:
+            pass
+        elif s_output_type == "obs-1q":
+            s_tex_label = _sigma_1q_label(s_obs_name, q_indices[0])
         elif s_output_type == "obs-2q":
             s_tex_label = (
                 f"\\sigma^{s_obs_name[0]}_{{{q_indices[0]}}} "
@@ -149,8 +210,8 @@ def prepare_2q_correlation_data(
 
     Returns:
             A tuple with the following two entries:
-                    obs_data: A tuple of two lists, the first being the time points, the second being
-                            the data.
+                    obs_data: A tuple of two arrays, the first being the time points, the second
+                            being the data.
                     s_tex_label: A formatted tex label for the data - note that this string does not
                             indicate that the data is of 2Q connected correlation (the subtraction of
                             the 1Q product).
@@ -175,12 +236,11 @@ def prepare_2q_correlation_data(
             # The data all comes from one simulation, so we can safely assume that the observation
             # times are identical, if they are equal in number. Verifying the time array lengths
             # will avoid crashes due to interrupted simulations with incomplete data files.
-            obs_data = (
-                obs_0[0],
-                (
-                    np.asarray(obs_2[1]) - np.asarray(obs_0[1]) * np.asarray(obs_1[1])
-                ).tolist(),
-            )
+            # Compute obs_2 - obs_0 * obs_1 with an explicit output buffer, avoiding
+            # the hidden temporary of the product on long time series.
+            conn = np.multiply(obs_0[1], obs_1[1], dtype=float)
+            np.subtract(obs_2[1], conn, out=conn)
+            obs_data = (obs_0[0], conn)
             s_tex_label = (
                 f"\\sigma^{s_obs_name[0]}_{{{q_indices[0]}}} "
                 f"\\sigma^{s_obs_name[1]}_{{{q_indices[1]}}}"
@@ -188,6 +248,83 @@ def prepare_2q_correlation_data(
     return obs_data, s_tex_label
 
 
+def prepare_2q_correlation_curves_batched(
+    result: dict, s_obs_name: str, qubit_pairs: Sequence[Tuple[int, int]]
+) -> (List[Optional[Tuple[List, List]]], List[str]):
+    """
+    Prepare the connected correlation curves of multiple qubit pairs in one batched operation.
+    The returned data is identical to calling `prepare_2q_correlation_data` for each pair, but
+    the subtraction of the 1Q products is performed on a single stacked matrix of all curves,
+    instead of pair by pair.
+
+    Args:
+            result: A dictionary from which the observables are taken.
+            s_obs_name: The name of the specific observable, used a key into the relevant
+                    observables dict, and also in formatting the descriptive tex labels of the data.
+            qubit_pairs: A sequence of tuples with the indices of the qubits identifying the
+                    correlation functions.
+
+    Returns:
+            A tuple with the following two entries:
+                    obs_data_list: A list with one entry per qubit pair - a tuple of the time points
+                            and the data, or None if the pair's observables are incomplete.
+                    s_tex_labels: A list with a formatted tex label for each qubit pair.
+    """
+    obs_1q_dict = result["obs-1q"]
+    obs_2q_dict = result["obs-2q"]
+    s_obs_name = s_obs_name.lower()
+    obs_data_list: List[Optional[Tuple[List, List]]] = [None] * len(qubit_pairs)
+    s_tex_labels = [""] * len(qubit_pairs)
+    if obs_1q_dict is None or obs_2q_dict is None:
+        return obs_data_list, s_tex_labels
+    # Collect the rows of all pairs with complete data of a common length, and fall back
+    # to the unbatched function for pairs whose data was truncated to a different length.
+    i_pairs = []
+    times_rows = []
+    rows_0 = []
+    rows_1 = []
+    rows_2 = []
+    n_times = None
+    for i_pair, q_pair in enumerate(qubit_pairs):
+        q_indices = tuple(q_pair)
+        obs_0 = obs_1q_dict.get((s_obs_name[0], (q_indices[0],)))
+        obs_1 = obs_1q_dict.get((s_obs_name[1], (q_indices[1],)))
+        obs_2 = obs_2q_dict.get((s_obs_name, q_indices))
+        if (
+            obs_0 is None
+            or obs_1 is None
+            or obs_2 is None
+            or len(obs_0[0]) != len(obs_1[0])
+            or len(obs_0[0]) != len(obs_2[0])
+        ):
+            continue
+        if n_times is None:
+            n_times = len(obs_0[0])
+        if len(obs_0[0]) != n_times:
+            obs_data_list[i_pair], s_tex_labels[i_pair] = prepare_2q_correlation_data(
+                result, s_obs_name, q_indices
+            )
+            continue
+        i_pairs.append(i_pair)
+        times_rows.append(obs_0[0])
+        rows_0.append(obs_0[1])
+        rows_1.append(obs_1[1])
+        rows_2.append(obs_2[1])
+    if i_pairs:
+        conn = np.multiply(
+            np.asarray(rows_0, dtype=float), np.asarray(rows_1, dtype=float)
+        )
+        np.subtract(np.asarray(rows_2, dtype=float), conn, out=conn)
+        for i_row, i_pair in enumerate(i_pairs):
+            q_indices = tuple(qubit_pairs[i_pair])
+            obs_data_list[i_pair] = (times_rows[i_row], conn[i_row])
+            s_tex_labels[i_pair] = (
+                f"\\sigma^{s_obs_name[0]}_{{{q_indices[0]}}} "
+                f"\\sigma^{s_obs_name[1]}_{{{q_indices[1]}}}"
+            )
+    return obs_data_list, s_tex_labels
+
+
 def prepare_2q_correlation_matrix(
     result: dict, s_obs_name: str, t: float, n_qubits: int
 ) -> (np.ndarray, str):
@@ -214,33 +351,161 @@ def prepare_2q_correlation_matrix(
     obs_2q_dict = result["obs-2q"]
     obs_data = np.full(shape=(n_qubits, n_qubits), dtype=float, fill_value=np.nan)
     s_obs_name = s_obs_name.lower()
-    r_qubits = range(n_qubits)
     # Below we verify that all required 1Q and 2Q observables have complete data available.
-    if obs_1q_dict is not None and obs_2q_dict is not None:
-        for i in r_qubits:
-            for j in r_qubits:
-                if i == j:
-                    continue
-                obs_0 = obs_1q_dict.get((s_obs_name[0], (i,)))
-                obs_1 = obs_1q_dict.get((s_obs_name[1], (j,)))
-                obs_2 = obs_2q_dict.get((s_obs_name, (i, j)))
-                if (
-                    obs_0 is not None
-                    and obs_1 is not None
-                    and obs_2 is not None
-                    and len(obs_0[0]) == len(obs_1[0])
-                    and len(obs_0[0]) == len(obs_2[0])
-                ):
-                    # The data all comes from one simulation, so we can safely assume that the time
-                    # arrays are identical, if they are equal in number. Verifying the time array lengths
-                    # will avoid crashes due to interrupted simulations with incomplete data files.
-                    try:
-                        t_index = obs_0[0].index(t)
-                        obs_data[i, j] = (
-                            obs_2[1][t_index] - obs_0[1][t_index] * obs_1[1][t_index]
-                        )
-                    except ValueError:
-                        pass
+    # The data all comes from one simulation, so we can safely assume that the time
+    # arrays are identical, if they are equal in number. Verifying the time array lengths
+    # will avoid crashes due to interrupted simulations with incomplete data files.
+    if obs_1q_dict is not None and obs_2q_dict is not None and len(obs_1q_dict):
+        ref_times = np.asarray(next(iter(obs_1q_dict.values()))[0])
+        n_times = len(ref_times)
+        t_index = _t_index(ref_times, t)
+        if t_index is not None:
+            # Gather the two 1Q-observable vectors and the 2Q-observable matrix at
+            # time t with a single pass over each dictionary, then form the
+            # connected correlation with array algebra instead of an N^2 Python loop.
+            b_symmetric = s_obs_name[0] == s_obs_name[1]
+            v_0 = np.full(n_qubits, np.nan)
+            # For a symmetric observable (e.g. 'zz') the two 1Q vectors coincide.
+            v_1 = v_0 if b_symmetric else np.full(n_qubits, np.nan)
+            for (s_name, q_indices), obs_1q in obs_1q_dict.items():
+                i = q_indices[0]
+                if i < n_qubits and len(obs_1q[0]) == n_times:
+                    if s_name == s_obs_name[0]:
+                        v_0[i] = obs_1q[1][t_index]
+                    if not b_symmetric and s_name == s_obs_name[1]:
+                        v_1[i] = obs_1q[1][t_index]
+            i_idx = []
+            j_idx = []
+            vals_at_t = []
+            for (s_name, q_indices), obs_2q in obs_2q_dict.items():
+                if s_name == s_obs_name and len(obs_2q[0]) == n_times:
+                    i, j = q_indices
+                    if i < n_qubits and j < n_qubits:
+                        i_idx.append(i)
+                        j_idx.append(j)
+                        vals_at_t.append(obs_2q[1][t_index])
+            m_2q = np.full((n_qubits, n_qubits), np.nan)
+            if i_idx:
+                # Scatter all 2Q values into the matrix with one fancy-index
+                # assignment instead of an element-wise loop.
+                m_2q[i_idx, j_idx] = vals_at_t
+            if b_symmetric:
+                # A symmetric observable's matrix obeys C[i, j] == C[j, i], so a
+                # simulation that recorded only one of (i, j) and (j, i) still
+                # yields the full matrix.
+                m_2q = np.where(np.isnan(m_2q), m_2q.T, m_2q)
+            # Form the outer product and the subtraction in-place in one buffer,
+            # instead of allocating a temporary for np.outer.
+            obs_data = np.multiply(v_0[:, np.newaxis], v_1[np.newaxis, :])
+            np.subtract(m_2q, obs_data, out=obs_data)
+            np.fill_diagonal(obs_data, np.nan)
+    s_tex_label = f"\\sigma^{s_obs_name[0]}_{{i}}\\sigma^{s_obs_name[1]}_{{j}}"
+    return obs_data, s_tex_label
+
+
+_connected_corr_cube_numba = None
+"""The compiled numba kernel for connected-correlation cubes, built on first use
+(False if disabled after a failed import, compilation or invocation)."""
+
+
+def _connected_corr_cube(
+    m_2q: np.ndarray, v_0: np.ndarray, v_1: np.ndarray
+) -> np.ndarray:
+    """Compute the connected-correlation cube ``m_2q[t, i, j] - v_0[t, i] * v_1[t, j]``.
+
+    A parallel numba kernel is used if the optional numba package is installed,
+    with a NumPy broadcasting fallback otherwise.
+
+    Args:
+            m_2q: The 2Q observable values, an array of shape (T, N, N).
+            v_0: The first 1Q observable values, an array of shape (T, N).
+            v_1: The second 1Q observable values, an array of shape (T, N).
+
+    Returns:
+            An array of shape (T, N, N) with the connected correlations.
+    """
+    global _connected_corr_cube_numba
+    if _HAS_NUMBA and _connected_corr_cube_numba is not False:
+        try:
+            if _connected_corr_cube_numba is None:
+                import numba
+
+                @numba.njit(parallel=True, fastmath=True)
+                def connected_corr_cube(m_2q, v_0, v_1):
+                    n_t = v_0.shape[0]
+                    n_qubits = v_0.shape[1]
+                    out = np.empty((n_t, n_qubits, n_qubits))
+                    for i_t in numba.prange(n_t):
+                        for i in range(n_qubits):
+                            for j in range(n_qubits):
+                                out[i_t, i, j] = (
+                                    m_2q[i_t, i, j] - v_0[i_t, i] * v_1[i_t, j]
+                                )
+                    return out
+
+                _connected_corr_cube_numba = connected_corr_cube
+            return _connected_corr_cube_numba(m_2q, v_0, v_1)
+        except Exception:  # pylint: disable=broad-except
+            # The optional accelerator must never break plotting - disable it
+            # and fall back to the numpy broadcasting below.
+            _connected_corr_cube_numba = False
+    return m_2q - v_0[:, :, np.newaxis] * v_1[:, np.newaxis, :]
+
+
+def prepare_2q_correlation_cube(
+    result: dict, s_obs_name: str, n_qubits: int
+) -> (Optional[Tuple[List, np.ndarray]], str):
+    """
+    Prepare the connected correlation matrices of one type for all qubits and all times.
+    The connected correlation is defined as a 2Q observable from which the product of the two
+    corresponding 1Q observables is subtracted, as in `prepare_2q_correlation_matrix`, which
+    gives the matrix of a single simulation time.
+
+    Args:
+            result: A dictionary from which the observables are taken.
+            s_obs_name: The name of the specific observable, used a key into the relevant
+                    observables dict, and also in formatting the descriptive tex label of the data.
+            n_qubits: The number of qubits in the simulation.
+
+    Returns:
+            A tuple with the following two entries:
+                    obs_data: A tuple of the time points and an array of shape (T, N, N) with the
+                            connected correlation functions of all qubits at all times, or None if
+                            no observables are available.
+                    s_tex_label: A formatted tex label for the data - note that this string does not
+                            indicate that the data is of 2Q connected correlation (the subtraction of
+                            the 1Q product).
+    """
+    obs_1q_dict = result["obs-1q"]
+    obs_2q_dict = result["obs-2q"]
+    obs_data = None
+    s_obs_name = s_obs_name.lower()
+    # Below we verify that all required 1Q and 2Q observables have complete data available.
+    # The data all comes from one simulation, so we can safely assume that the time
+    # arrays are identical, if they are equal in number. Verifying the time array lengths
+    # will avoid crashes due to interrupted simulations with incomplete data files.
+    if obs_1q_dict is not None and obs_2q_dict is not None and len(obs_1q_dict):
+        ref_times = next(iter(obs_1q_dict.values()))[0]
+        n_times = len(ref_times)
+        v_0 = np.full((n_times, n_qubits), np.nan)
+        v_1 = np.full((n_times, n_qubits), np.nan)
+        for (s_name, q_indices), obs_1q in obs_1q_dict.items():
+            i = q_indices[0]
+            if i < n_qubits and len(obs_1q[0]) == n_times:
+                if s_name == s_obs_name[0]:
+                    v_0[:, i] = obs_1q[1]
+                if s_name == s_obs_name[1]:
+                    v_1[:, i] = obs_1q[1]
+        m_2q = np.full((n_times, n_qubits, n_qubits), np.nan)
+        for (s_name, q_indices), obs_2q in obs_2q_dict.items():
+            if s_name == s_obs_name and len(obs_2q[0]) == n_times:
+                i, j = q_indices
+                if i < n_qubits and j < n_qubits:
+                    m_2q[:, i, j] = obs_2q[1]
+        cube = _connected_corr_cube(m_2q, v_0, v_1)
+        for i in range(n_qubits):
+            cube[:, i, i] = np.nan
+        obs_data = (ref_times, cube)
     s_tex_label = f"\\sigma^{s_obs_name[0]}_{{i}}\\sigma^{s_obs_name[1]}_{{j}}"
     return obs_data, s_tex_label
 
@@ -267,27 +532,30 @@ def prepare_xy_current_data(
     obs_2q_dict = result["obs-2q"]
     obs_data = np.full(shape=(len(qubit_pairs),), dtype=float, fill_value=np.nan)
     s_obs_name = "xy"
-    if obs_2q_dict is not None:
-        for i_bond, bond in enumerate(qubit_pairs):
-            i = bond[0]
-            j = bond[1]
-            if i == j:
-                continue
-            obs_1 = obs_2q_dict.get((s_obs_name, (i, j)))
-            obs_2 = obs_2q_dict.get((s_obs_name, (j, i)))
-            if (
-                obs_1 is not None
-                and obs_2 is not None
-                and len(obs_1[0]) == len(obs_2[0])
-            ):
-                # The data all comes from one simulation, so we can safely assume that the time
-                # arrays are identical, if they are equal in number. Verifying the time array lengths
-                # will avoid crashes due to interrupted simulations with incomplete data files.
-                try:
-                    t_index = obs_2[0].index(t)
+    # The data all comes from one simulation, so we can safely assume that the time
+    # arrays are identical, if they are equal in number. Verifying the time array lengths
+    # will avoid crashes due to interrupted simulations with incomplete data files.
+    if obs_2q_dict is not None and len(obs_2q_dict):
+        ref_times = next(iter(obs_2q_dict.values()))[0]
+        n_times = len(ref_times)
+        # Locate the time once with a binary search, so that each bond needs only
+        # the O(1) dictionary lookups of its observables.
+        t_index = _t_index(ref_times, t)
+        if t_index is not None:
+            for i_bond, bond in enumerate(qubit_pairs):
+                i = bond[0]
+                j = bond[1]
+                if i == j:
+                    continue
+                obs_1 = obs_2q_dict.get((s_obs_name, (i, j)))
+                obs_2 = obs_2q_dict.get((s_obs_name, (j, i)))
+                if (
+                    obs_1 is not None
+                    and obs_2 is not None
+                    and len(obs_1[0]) == n_times
+                    and len(obs_2[0]) == n_times
+                ):
                     obs_data[i_bond] = 0.5 * (obs_1[1][t_index] - obs_2[1][t_index])
-                except ValueError:
-                    pass
     s_tex_label = (
         f"\\frac{{1}}{{2}}\\left(\\sigma^{s_obs_name[0]}_{{i}}\\sigma^{s_obs_name[1]}_{{j}} -"
         f"\\sigma^{s_obs_name[1]}_{{i}}\\sigma^{s_obs_name[0]}_{{j}}\\right)"
@@ -477,7 +745,7 @@ def plot_curves(
     """
     if ax is None:
         _, ax = plt.subplots(figsize=figsize)
-    plt.rcParams.update({"font.size": fontsize})
+    ax.tick_params(labelsize=fontsize)
     if line_styles is None:
         line_styles = LINDBLADMPO_LINE_STYLES
     n_styles = len(line_styles)
@@ -494,7 +762,7 @@ def plot_curves(
         ax.legend(fontsize=fontsize)
     ax.set_xlabel("$t$", fontsize=fontsize)
     if s_title != "":
-        ax.set_title(s_title)
+        ax.set_title(s_title, fontsize=fontsize)
     return ax
 
 
@@ -540,13 +808,57 @@ def prepare_1q_space_time_data(
         qubits = np.arange(N)
     n_qubits = len(qubits)
     data = np.full(shape=(n_qubits, n_t_steps), dtype=float, fill_value=np.nan)
-    for i_q, qubit in enumerate(qubits):
-        obs_data, _ = prepare_curve_data(result, "obs-1q", s_obs_name, (qubit,))
-        if obs_data is not None:
-            data[i_q, :] = obs_data[1][0:n_t_steps]
+    # Gather the rows from the memoized dense observable matrix, which is shared
+    # across the plots of one result dict.
+    matrix = _get_1q_matrix(result, s_obs_name.lower())
+    if matrix is not None:
+        n_cols = min(matrix.shape[1], n_t_steps)
+        q_arr = np.asarray(qubits)
+        rows = np.nonzero(q_arr < matrix.shape[0])[0]
+        data[rows, :n_cols] = matrix[q_arr[rows], :n_cols]
     return data, t_tick_indices, t_tick_labels, qubits
 
 
+def _get_1q_matrix(result: dict, s_obs_name: str) -> Optional[np.ndarray]:
+    """Return a dense (N, T) matrix of a 1Q observable's data for all qubits.
+
+    The matrix is built once per observable name and memoized on the result dict
+    under the '_cache_1q' key, so the plots of one notebook session share a single
+    build. Qubits with missing or truncated data are NaN-padded. The returned
+    matrix is read-only; code that mutates the observables dict should delete the
+    '_cache_1q' entry to invalidate it.
+
+    Args:
+            result: A dictionary from which the observables are taken.
+            s_obs_name: The (lower-case) name of the single-qubit observable.
+
+    Returns:
+            The (N, T) matrix, or None if there is no 1Q data for this observable.
+    """
+    obs_dict = result["obs-1q"]
+    if obs_dict is None:
+        return None
+    cache = result.setdefault("_cache_1q", {})
+    matrix = cache.get(s_obs_name)
+    if matrix is None:
+        entries = {
+            q_indices[0]: obs
+            for (s_name, q_indices), obs in obs_dict.items()
+            if s_name == s_obs_name
+        }
+        if not entries:
+            return None
+        n_qubits = max(entries) + 1
+        n_times = max(len(obs[0]) for obs in entries.values())
+        matrix = np.full((n_qubits, n_times), np.nan)
+        for qubit, obs in entries.items():
+            values = obs[1]
+            matrix[qubit, : len(values)] = values
+        matrix.setflags(write=False)
+        cache[s_obs_name] = matrix
+    return matrix
+
+
 def prepare_2q_space_time_data(
     parameters: dict,
     result: dict,
@@ -603,7 +915,9 @@ def prepare_2q_space_time_data(
             qubits_pair = (qubit, qubit_1)
         else:  # else can be used according to the verification above
             qubits_pair = (qubit_0, qubit)
-        obs_data, _ = prepare_curve_data(result, "obs-2q", s_obs_name, qubits_pair)
+        obs_data, _ = prepare_curve_data(
+            result, "obs-2q", s_obs_name, qubits_pair, build_label=False
+        )
         if obs_data is not None:
             data[i_q, :] = obs_data[1][0:n_t_steps]
     return data, t_tick_indices, t_tick_labels, qubits
@@ -646,6 +960,7 @@ def plot_1q_space_time(
     fontsize=16,
     b_save_figures=True,
     s_file_prefix="",
+    b_close_figures=False,
 ):
     """
     Plot a single-qubit space-time (qubit-time) diagram.
@@ -661,16 +976,19 @@ def plot_1q_space_time(
             fontsize: The fontsize to use in the figure.
             b_save_figures: Whether to save the plotted figure to file.
             s_file_prefix: An optional path and file name prefix for the saved figures.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
 
     """
     s_obs_name = s_obs_name.lower()
+    b_fig_created = ax is None
     if ax is None:
         _, ax = plt.subplots(figsize=(10, 6))
-    plt.rcParams.update({"font.size": fontsize})
     im = ax.imshow(data, interpolation="none", aspect="auto")
     divider = make_axes_locatable(ax)
     cax = divider.append_axes("right", size="5%", pad=0.05)
     plt.colorbar(im, cax=cax)
+    cax.tick_params(labelsize=fontsize)
     # plt.colorbar(im)
     ax.set_xlabel("$t$", fontsize=fontsize)
     ax.set_xticks(t_tick_indices)
@@ -679,9 +997,15 @@ def plot_1q_space_time(
     ax.set_yticklabels(qubits, fontsize=fontsize)
     ax.set_ylabel("$j$", fontsize=fontsize)
     s_title = f"$\\langle\\sigma^{s_obs_name}(t)\\rangle$"
-    ax.set_title(s_title)
+    ax.set_title(s_title, fontsize=fontsize)
     s_file_label = f"sigma_{s_obs_name}.st"
-    _save_fig(b_save_figures, s_file_prefix, s_file_label)
+    _save_fig(
+        b_save_figures,
+        s_file_prefix,
+        s_file_label,
+        ax,
+        b_close_figures and b_fig_created,
+    )
 
 
 def plot_2q_correlation_matrix(
@@ -694,6 +1018,7 @@ def plot_2q_correlation_matrix(
     b_save_figures=True,
     s_file_prefix="",
     s_title=None,
+    b_close_figures=False,
 ):
     """
     Plot a two-qubit connected correlation matrix figure.
@@ -709,15 +1034,18 @@ def plot_2q_correlation_matrix(
             b_save_figures: Whether to save the plotted figure to file.
             s_file_prefix: An optional path and file name prefix for the saved figures.
             s_title: An optional title for the figure. If empty, a default title is formatted.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     """
     s_obs_name = s_obs_name.lower()
+    b_fig_created = ax is None
     if ax is None:
         _, ax = plt.subplots(figsize=(8, 7))
-    plt.rcParams.update({"font.size": fontsize})
     im = ax.imshow(data, interpolation="none", aspect="equal")
     divider = make_axes_locatable(ax)
     cax = divider.append_axes("right", size="3.5%", pad=0.15)
     plt.colorbar(im, cax=cax)
+    cax.tick_params(labelsize=fontsize)
     # plt.colorbar(im)
     n_qubits = len(qubits)
     if n_qubits <= 10:
@@ -734,9 +1062,15 @@ def plot_2q_correlation_matrix(
     s_tex_label = f"\\sigma^{s_obs_name[0]}_{{i}}\\sigma^{s_obs_name[1]}_{{j}}"
     if s_title is None:
         s_title = f"$\\langle{s_tex_label}(t={t})\\rangle_{{c}}$"
-    ax.set_title(s_title)
+    ax.set_title(s_title, fontsize=fontsize)
     s_file_label = f"sigma_{s_obs_name[0]}.sigma_{s_obs_name[1]}.c.t={t}"
-    _save_fig(b_save_figures, s_file_prefix, s_file_label)
+    _save_fig(
+        b_save_figures,
+        s_file_prefix,
+        s_file_label,
+        ax,
+        b_close_figures and b_fig_created,
+    )
 
 
 def plot_full_1q_space_time(
@@ -747,6 +1081,7 @@ def plot_full_1q_space_time(
     fontsize=16,
     b_save_figures=True,
     s_file_prefix="",
+    b_close_figures=False,
 ):
     """
     Prepare the data and plot a single-qubit space-time (qubit-time) diagram.
@@ -760,6 +1095,8 @@ def plot_full_1q_space_time(
             fontsize: The fontsize to use in the figure.
             b_save_figures: Whether to save the plotted figure to file.
             s_file_prefix: An optional path and file name prefix for the saved figures.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     """
     data, t_tick_indices, t_tick_labels, qubits = prepare_1q_space_time_data(
         parameters, result, s_obs_name
@@ -774,6 +1111,7 @@ def plot_full_1q_space_time(
         fontsize,
         b_save_figures,
         s_file_prefix,
+        b_close_figures,
     )
 
 
@@ -787,6 +1125,7 @@ def plot_full_2q_correlation_matrix(
     b_save_figures=True,
     s_file_prefix="",
     s_title=None,
+    b_close_figures=False,
 ):
     """
     Prepare the data and plot a two-qubit connected correlation matrix figure.
@@ -802,6 +1141,8 @@ def plot_full_2q_correlation_matrix(
             b_save_figures: Whether to save the plotted figure to file.
             s_file_prefix: An optional path and file name prefix for the saved figures.
             s_title: An optional title for the figure. If empty, a default title is formatted.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     """
     if t is None:
         t = parameters["t_final"]
@@ -816,6 +1157,7 @@ def plot_full_2q_correlation_matrix(
         b_save_figures,
         s_file_prefix,
         s_title,
+        b_close_figures,
     )
 
 
@@ -831,6 +1173,7 @@ def plot_1q_obs_curves(
     s_file_prefix="",
     s_title=None,
     b_legend_labels=True,
+    b_close_figures=False,
 ):
     """
     Prepare the data and plot a single-qubit observable vs. time for multiple qubits.
@@ -849,6 +1192,8 @@ def plot_1q_obs_curves(
             s_file_prefix: An optional path and file name prefix for the saved figures.
             s_title: An optional title for the figure. If empty, a default title is formatted.
             b_legend_labels: Whether to add labels to the curves and plot a legend.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     """
     obs_data_list = []
     tex_labels = [] if b_legend_labels else None
@@ -862,6 +1207,7 @@ def plot_1q_obs_curves(
             tex_labels.append(f"$\\langle{s_tex_label}(t)\\rangle$")
     if s_title is None:
         s_title = f"$\\langle\\sigma^{s_obs_name}_j(t)\\rangle$"
+    b_fig_created = ax is None
     ax = plot_curves(
         obs_data_list, tex_labels, s_title, ax, fontsize, line_styles=line_styles
     )
@@ -870,7 +1216,13 @@ def plot_1q_obs_curves(
     ax.set_xticks(t_tick_labels)
     ax.set_xticklabels(t_tick_labels, fontsize=fontsize)
     s_file_label = f"sigma_{s_obs_name}"
-    _save_fig(b_save_figures, s_file_prefix, s_file_label)
+    _save_fig(
+        b_save_figures,
+        s_file_prefix,
+        s_file_label,
+        ax,
+        b_close_figures and b_fig_created,
+    )
 
 
 def plot_2q_obs_curves(
@@ -884,6 +1236,7 @@ def plot_2q_obs_curves(
     s_file_prefix="",
     s_title=None,
     b_legend_labels=True,
+    b_close_figures=False,
 ):
     """
     Prepare the data and plot a two-qubit observable vs. time for multiple qubits.
@@ -900,11 +1253,22 @@ def plot_2q_obs_curves(
             s_file_prefix: An optional path and file name prefix for the saved figures.
             s_title: An optional title for the figure. If empty, a default title is formatted.
             b_legend_labels: Whether to add labels to the curves and plot a legend.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     """
     obs_data_list = []
     tex_labels = [] if b_legend_labels else None
     s_obs_name = s_obs_name.lower()
-    for q_pair in qubit_pairs:
+    # Filter out pairs with no recorded observable up front - users often record
+    # only e.g. nearest-neighbor correlators, making most of a dense pair list
+    # not worth preparing labels for.
+    obs_2q_dict = result["obs-2q"]
+    valid_pairs = (
+        [q_pair for q_pair in qubit_pairs if (s_obs_name, tuple(q_pair)) in obs_2q_dict]
+        if obs_2q_dict is not None
+        else []
+    )
+    for q_pair in valid_pairs:
         obs_data, s_tex_label = prepare_curve_data(result, "obs-2q", s_obs_name, q_pair)
         if obs_data is not None:
             obs_data_list.append(obs_data)
@@ -914,13 +1278,20 @@ def plot_2q_obs_curves(
         s_title = (
             f"$\\langle\\sigma^{s_obs_name[0]}_i\\sigma^{s_obs_name[1]}_j(t)\\rangle$"
         )
+    b_fig_created = ax is None
     ax = plot_curves(obs_data_list, tex_labels, s_title, ax, fontsize)
     _, _, t_tick_labels, _ = prepare_time_data(parameters)
     # ax.set_xticks(t_tick_indices)
     ax.set_xticks(t_tick_labels)
     ax.set_xticklabels(t_tick_labels, fontsize=fontsize)
     s_file_label = f"sigma_{s_obs_name[0]}.sigma_{s_obs_name[1]}"
-    _save_fig(b_save_figures, s_file_prefix, s_file_label)
+    _save_fig(
+        b_save_figures,
+        s_file_prefix,
+        s_file_label,
+        ax,
+        b_close_figures and b_fig_created,
+    )
 
 
 def plot_3q_obs_curves(
@@ -934,6 +1305,7 @@ def plot_3q_obs_curves(
     s_file_prefix="",
     s_title=None,
     b_legend_labels=True,
+    b_close_figures=False,
 ) -> (Any, List[Tuple[List, List]]):
     """
     Prepare the data and plot a two-qubit observable vs. time for multiple qubits.
@@ -950,6 +1322,8 @@ def plot_3q_obs_curves(
             s_file_prefix: An optional path and file name prefix for the saved figures.
             s_title: An optional title for the figure. If empty, a default title is formatted.
             b_legend_labels: Whether to add labels to the curves and plot a legend.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     Returns:
             A tuple of two members:
                 ax: The axis object.
@@ -972,13 +1346,20 @@ def plot_3q_obs_curves(
             f"$\\langle\\sigma^{s_obs_name[0]}_i"
             f"\\sigma^{s_obs_name[1]}_j\\sigma^{s_obs_name[2]}_k(t)\\rangle$"
         )
+    b_fig_created = ax is None
     ax = plot_curves(obs_data_list, tex_labels, s_title, ax, fontsize)
     _, _, t_tick_labels, _ = prepare_time_data(parameters)
     # ax.set_xticks(t_tick_indices)
     ax.set_xticks(t_tick_labels)
     ax.set_xticklabels(t_tick_labels, fontsize=fontsize)
     s_file_label = f"sigma_{s_obs_name[0]}.sigma_{s_obs_name[1]}.sigma_{s_obs_name[2]}"
-    _save_fig(b_save_figures, s_file_prefix, s_file_label)
+    _save_fig(
+        b_save_figures,
+        s_file_prefix,
+        s_file_label,
+        ax,
+        b_close_figures and b_fig_created,
+    )
     return ax, obs_data_list
 
 
@@ -992,6 +1373,7 @@ def plot_2q_correlation_curves(
     b_save_figures=True,
     s_file_prefix="",
     s_title=None,
+    b_close_figures=False,
 ):
     """
     Prepare the data and plot a two-qubit connected correlation curve vs. time for multiple qubits.
@@ -1007,24 +1389,35 @@ def plot_2q_correlation_curves(
             b_save_figures: Whether to save the plotted figure to file.
             s_file_prefix: An optional path and file name prefix for the saved figures.
             s_title: An optional title for the figure. If empty, a default title is formatted.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     """
+    s_obs_name = s_obs_name.lower()
+    batched_data, batched_labels = prepare_2q_correlation_curves_batched(
+        result, s_obs_name, qubit_pairs
+    )
     obs_data_list = []
     tex_labels = []
-    s_obs_name = s_obs_name.lower()
-    for q_pair in qubit_pairs:
-        obs_data, s_tex_label = prepare_2q_correlation_data(result, s_obs_name, q_pair)
+    for obs_data, s_tex_label in zip(batched_data, batched_labels):
         if obs_data is not None:
             obs_data_list.append(obs_data)
             tex_labels.append(f"$\\langle{s_tex_label}(t)\\rangle_{{c}}$")
     if s_title is None:
         s_title = f"$\\langle\\sigma^{s_obs_name[0]}_i\\sigma^{s_obs_name[1]}_j(t)\\rangle_{{c}}$"
+    b_fig_created = ax is None
     ax = plot_curves(obs_data_list, tex_labels, s_title, ax, fontsize)
     _, _, t_tick_labels, _ = prepare_time_data(parameters)
     # ax.set_xticks(t_tick_indices)
     ax.set_xticks(t_tick_labels)
     ax.set_xticklabels(t_tick_labels, fontsize=fontsize)
     s_file_label = f"sigma_{s_obs_name[0]}.sigma_{s_obs_name[1]}.c"
-    _save_fig(b_save_figures, s_file_prefix, s_file_label)
+    _save_fig(
+        b_save_figures,
+        s_file_prefix,
+        s_file_label,
+        ax,
+        b_close_figures and b_fig_created,
+    )
 
 
 def plot_global_obs_curve(
@@ -1035,6 +1428,7 @@ def plot_global_obs_curve(
     fontsize=16,
     b_save_figures=True,
     s_file_prefix="",
+    b_close_figures=False,
 ):
     """
     Prepare the data and plot a global quantity curve vs. time.
@@ -1048,17 +1442,26 @@ def plot_global_obs_curve(
             fontsize: The fontsize to use in the figure.
             b_save_figures: Whether to save the plotted figure to file.
             s_file_prefix: An optional path and file name prefix for the saved figures.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     """
     s_obs_name = s_obs_name.lower()
     obs_data, s_tex_label = prepare_curve_data(result, "global", s_obs_name, ())
     s_title = f"${s_tex_label}(t)$"
+    b_fig_created = ax is None
     ax = plot_curves([obs_data], [s_title], s_title, ax, fontsize)
     _, _, t_tick_labels, _ = prepare_time_data(parameters)
     # ax.set_xticks(t_tick_indices)
     ax.set_xticks(t_tick_labels)
     ax.set_xticklabels(t_tick_labels, fontsize=fontsize)
     s_file_label = s_obs_name
-    _save_fig(b_save_figures, s_file_prefix, s_file_label)
+    _save_fig(
+        b_save_figures,
+        s_file_prefix,
+        s_file_label,
+        ax,
+        b_close_figures and b_fig_created,
+    )
 
 
 def plot_1d_current_curve(
@@ -1072,6 +1475,7 @@ def plot_1d_current_curve(
     s_file_prefix="",
     s_title=None,
     b_legend_labels=True,
+    b_close_figures=False,
 ):
     """
     Prepare the data and plot the current expectation value at time t, assuming a 1D topology.
@@ -1089,6 +1493,8 @@ def plot_1d_current_curve(
             s_file_prefix: An optional path and file name prefix for the saved figures.
             s_title: An optional title for the figure. If empty, a default title is formatted.
             b_legend_labels: Whether to add labels to the curves and plot a legend.
+            b_close_figures: Whether to close an internally created figure after saving it,
+                    keeping memory flat when generating many figures in a loop.
     """
     obs_data_list = []
     tex_labels = [] if b_legend_labels else None
@@ -1109,9 +1515,10 @@ def plot_1d_current_curve(
             f"$\\frac{{1}}{{2}}\\langle\\sigma^{s_obs_name[0]}_{{i}}\\sigma^{s_obs_name[1]}_{{i+1}} -"
             f"\\sigma^{s_obs_name[1]}_{{i}}\\sigma^{s_obs_name[0]}_{{i+1}}\\rangle(t)$"
         )
+    b_fig_created = ax is None
     if ax is None:
         _, ax = plt.subplots(figsize=(10, 6))
-    plt.rcParams.update({"font.size": fontsize})
+    ax.tick_params(labelsize=fontsize)
     line_styles = LINDBLADMPO_LINE_STYLES
     linewidth = 3
     n_styles = len(line_styles)
@@ -1130,8 +1537,14 @@ def plot_1d_current_curve(
     ax.set_xlabel("bond $i$", fontsize=fontsize)
     ax.set_ylabel("", fontsize=fontsize)
     if s_title != "":
-        ax.set_title(s_title)
+        ax.set_title(s_title, fontsize=fontsize)
     ax.set_xticks(x_qubits)
     ax.set_xticklabels(x_qubits, fontsize=fontsize)
     s_file_label = "current-1d"
-    _save_fig(b_save_figures, s_file_prefix, s_file_label)
+    _save_fig(
+        b_save_figures,
+        s_file_prefix,
+        s_file_label,
+        ax,
+        b_close_figures and b_fig_created,
+    )
@@ -14,9 +14,26 @@ import subprocess
 
 from setuptools import setup, find_packages, Extension
 
+LONG_DESCRIPTION_SKIP_RE = re.compile(
+    "<!--- long-description-skip-begin -->.*<!--- long-description-skip-end -->",
+    re.S | re.M,
+)
+
 with open("requirements.txt") as f:
     REQUIREMENTS = f.read().splitlines()
 
+
+def _solver_up_to_date(s_solver_file: str) -> bool:
+    """Returns whether the built solver binary is newer than all solver sources."""
+    if not os.path.isfile(s_solver_file):
+        return False
+    solver_mtime = os.path.getmtime(s_solver_file)
+    for s_file in os.listdir("./src/"):
+        if os.path.getmtime(os.path.join("./src/", s_file)) > solver_mtime:
+            return False
+    return True
+
+
 s_system = platform.system().lower()
 if s_system == "windows":
     s_executable = "lindbladmpo.exe"
@@ -33,40 +50,46 @@ else:
     else:
         s_target_os = "LINUX"
 
-    process = subprocess.Popen(
-        f"git clone https://github.com/ITensor/ITensor.git itensor3/", shell=True
-    )
-    exit_code = process.wait()
-    if exit_code != 0:
-        raise Exception("Cloning of ITensor repo using a git command failed.")
-    shutil.copy("./src/options.mk", "itensor3/")
+    # Skip the ITensor clone and the solver build entirely when the packaged
+    # binary is already newer than all solver sources, so that repeated editable
+    # installs during development are a no-op.
+    if not _solver_up_to_date(f"./lindbladmpo/{s_executable}"):
+        process = subprocess.Popen(
+            f"git clone https://github.com/ITensor/ITensor.git itensor3/", shell=True
+        )
+        exit_code = process.wait()
+        if exit_code != 0:
+            raise Exception("Cloning of ITensor repo using a git command failed.")
+        shutil.copy("./src/options.mk", "itensor3/")
 
-    exit_code = subprocess.call(f"cd itensor3 && make configure", shell=True)
-    if exit_code != 0:
-        pass
+        exit_code = subprocess.call(f"cd itensor3 && make configure", shell=True)
+        if exit_code != 0:
+            pass
 
-    exit_code = subprocess.call(
-        f"cd itensor3/itensor && make build OS_TARGET={s_target_os}", shell=True
-    )
-    if exit_code != 0:
-        pass
-    process = subprocess.Popen(
-        f"make -C ./src/ ITENSOR3_DIR=../itensor3 OS_TARGET={s_target_os}", shell=True
-    )
-    exit_code = process.wait()
-    if exit_code != 0:
-        pass
-    shutil.copy(f"./bin/{s_executable}", "./lindbladmpo/")
-    shutil.rmtree("itensor3")
+        # Build with one make job per core - the C++ builds dominate the install time.
+        n_jobs = os.cpu_count() or 2
+        exit_code = subprocess.call(
+            f"cd itensor3/itensor && make build -j{n_jobs} OS_TARGET={s_target_os}",
+            shell=True,
+        )
+        if exit_code != 0:
+            pass
+        subprocess.check_call(
+            [
+                "make",
+                "-C",
+                "./src/",
+                f"-j{n_jobs}",
+                "ITENSOR3_DIR=../itensor3",
+                f"OS_TARGET={s_target_os}",
+            ]
+        )
+        shutil.copy(f"./bin/{s_executable}", "./lindbladmpo/")
+        shutil.rmtree("itensor3")
 
 # Read long description from README.
 with open("README.md") as readme_file:
-    README = re.sub(
-        "<!--- long-description-skip-begin -->.*<!--- long-description-skip-end -->",
-        "",
-        readme_file.read(),
-        flags=re.S | re.M,
-    )
+    README = LONG_DESCRIPTION_SKIP_RE.sub("", readme_file.read())
 
 setup(
     name="lindbladmpo",
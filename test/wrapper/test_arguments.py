@@ -10,6 +10,7 @@
 Tests of the solver parameters handling.
 """
 
+import tempfile
 import unittest
 import numpy as np
 from lindbladmpo.LindbladMPOSolver import LindbladMPOSolver
@@ -1097,6 +1098,143 @@ class LindbladMPOSolverTestArguments(unittest.TestCase):
         except Exception:
             self.assertTrue(False, "Test failed, exception was not expected")
 
+    def test_verify_cache(self):
+        """Test that memoization of verified parameters is by value, so that a
+        modification invalidates the previous verification result."""
+        parameters = {
+            "N": 3,
+            "t_final": DEFAULT_T_FINAL,
+            "tau": DEFAULT_TAU,
+            "h_x": np.asarray([0.5, 0.5, 0.5]),
+        }
+        self.assertEqual("", LindbladMPOSolver.verify_parameters(parameters))
+        # A second verification of identical parameters should pass (from the cache).
+        self.assertEqual("", LindbladMPOSolver.verify_parameters(parameters))
+        # A modification (also in-place) of a value must not hit the cached result.
+        parameters["h_x"] = np.asarray([0.5, 0.5, 0.5, 0.5])
+        self.assertNotEqual("", LindbladMPOSolver.verify_parameters(parameters))
+        parameters["N"] = 4
+        self.assertEqual("", LindbladMPOSolver.verify_parameters(parameters))
+
+    def test_build_skip_rewrite(self):
+        """Test that build() skips rewriting an unchanged input file, but does
+        rewrite it after an in-place modification of an array parameter."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            J = np.zeros((3, 3))
+            J[0, 1] = 1.0
+            parameters = {
+                "N": 3,
+                "t_final": DEFAULT_T_FINAL,
+                "tau": DEFAULT_TAU,
+                "J": J,
+                "output_files_prefix": s_dir + "/test",
+            }
+            solver = LindbladMPOSolver(parameters)
+            solver.build()
+            # Mark the file externally - a skipped rebuild must leave the mark intact.
+            with open(solver.s_input_file, "a") as file:
+                file.write("# sentinel\n")
+            solver.build()
+            with open(solver.s_input_file) as file:
+                self.assertIn("# sentinel", file.read())
+            # An in-place mutation of the coupling matrix must force a rewrite.
+            J[0, 1] = 99.0
+            solver.build()
+            with open(solver.s_input_file) as file:
+                s_content = file.read()
+            self.assertNotIn("# sentinel", s_content)
+            self.assertIn("99", s_content)
+
+    def test_read_data_file_1q(self):
+        """Test the parsing of a 1-qubit observables output file, verifying the
+        op names, qubit indices, first-appearance ordering, and data values."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            s_prefix = s_dir + "/test"
+            with open(s_prefix + ".obs-1q.dat", "w") as file:
+                file.write("#time\top\tq\tvalue\n")
+                file.write("0\tX\t1\t0.25\n")
+                file.write("0\tX\t2\t0.5\n")
+                file.write("0\tZ\t1\t-1\n")
+                file.write("\n")
+                file.write("0.1\tX\t1\t0.125\n")
+                file.write("0.1\tX\t2\t0.75\n")
+                file.write("0.1\tZ\t1\t-0.5\n")
+            result = LindbladMPOSolver._read_data_file(s_prefix, "obs-1q")
+        # Op names are lowercased and the 1-based file indices become 0-based.
+        self.assertEqual(list(result.keys()), [("x", (0,)), ("x", (1,)), ("z", (0,))])
+        t_arr, val_arr = result[("x", (1,))]
+        self.assertTrue(np.array_equal(t_arr, [0.0, 0.1]))
+        self.assertTrue(np.array_equal(val_arr, [0.5, 0.75]))
+        t_arr, val_arr = result[("z", (0,))]
+        self.assertTrue(np.array_equal(val_arr, [-1.0, -0.5]))
+
+    def test_read_data_file_global(self):
+        """Test the parsing of a global observables output file (no qubit index
+        columns), with a truncated last line as left by an interrupted solver."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            s_prefix = s_dir + "/test"
+            with open(s_prefix + ".global.dat", "w") as file:
+                file.write("#time\top\tvalue\n")
+                file.write("0\tS\t0.5\n")
+                file.write("0\tOSEE_center\t1.5\n")
+                file.write("0.1\tS\t0.75\n")
+                file.write("0.1\tOSEE_cen")  # A truncated last line.
+            result = LindbladMPOSolver._read_data_file(s_prefix, "global")
+        self.assertEqual(list(result.keys()), [("s", ()), ("osee_center", ())])
+        t_arr, val_arr = result[("s", ())]
+        self.assertTrue(np.array_equal(t_arr, [0.0, 0.1]))
+        self.assertTrue(np.array_equal(val_arr, [0.5, 0.75]))
+        # The truncated line must be dropped without affecting the valid rows.
+        t_arr, val_arr = result[("osee_center", ())]
+        self.assertTrue(np.array_equal(t_arr, [0.0]))
+        self.assertTrue(np.array_equal(val_arr, [1.5]))
+
+    def test_read_data_file_empty(self):
+        """Test that an empty file, a header-only file, and a missing file all
+        parse into an empty result dictionary."""
+        with tempfile.TemporaryDirectory() as s_dir:
+            s_prefix = s_dir + "/test"
+            with open(s_prefix + ".obs-1q.dat", "w") as file:
+                pass
+            with open(s_prefix + ".obs-2q.dat", "w") as file:
+                file.write("#time\top\tq1\tq2\tvalue\n")
+            self.assertEqual({}, LindbladMPOSolver._read_data_file(s_prefix, "obs-1q"))
+            self.assertEqual({}, LindbladMPOSolver._read_data_file(s_prefix, "obs-2q"))
+            self.assertEqual({}, LindbladMPOSolver._read_data_file(s_prefix, "global"))
+
+    def test_build_input_file(self):
+        """Test the contents of the input file written by build(), in particular
+        the bond indices derived from the coupling matrix and the 1-based
+        serialization of the qubit index parameters."""
+        J = np.zeros((3, 3))
+        J[0, 1] = 1.5
+        J[2, 0] = -0.5
+        with tempfile.TemporaryDirectory() as s_dir:
+            parameters = {
+                "N": 3,
+                "t_final": DEFAULT_T_FINAL,
+                "tau": DEFAULT_TAU,
+                "J": J,
+                "h_x": np.asarray([0.25, 0.5, 0.75]),
+                "1q_components": ["X", "Z"],
+                "2q_indices": [(0, 2)],
+                "output_files_prefix": s_dir + "/test",
+            }
+            solver = LindbladMPOSolver(parameters)
+            solver.build()
+            with open(solver.s_input_file) as file:
+                lines = file.read().splitlines()
+        entries = dict(line.split(" = ") for line in lines)
+        self.assertEqual(entries["N"], "3")
+        # The J values are emitted at the nonzero bonds, in row-major order, and
+        # the bond indices are written 1-based for the solver.
+        self.assertEqual(entries["J"], "1.5,-0.5")
+        self.assertEqual(entries["first_bond_indices"], "1,3")
+        self.assertEqual(entries["second_bond_indices"], "2,1")
+        self.assertEqual(entries["h_x"], "0.25,0.5,0.75")
+        self.assertEqual(entries["1q_components"], "X,Z")
+        self.assertEqual(entries["2q_indices"], "1,3")
+
 
 if __name__ == "__main__":
     unittest.main()